@@ -1,3 +1,64 @@
+from collections.abc import MutableMapping
+
 from .settings import MassPaymentsSettings
 
-CACHE_VALUES = {"settings": MassPaymentsSettings()}
+
+class CacheValues(MutableMapping):
+    """
+    Class for the values shared across the script process
+    Values are read and written as attributes. Map access is kept so the
+    cache can still be used (and patched) like a dict.
+
+    :param values: Initial cache values
+    """
+
+    __slots__ = (
+        "settings",
+        "output_format",
+        "source_address",
+        "source_signing_key_file",
+        "metadata_file",
+        "pycardano_context",
+    )
+
+    def __init__(self, **values):
+        for key in self.__slots__:
+            setattr(self, key, None)
+        self.update(values)
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        try:
+            delattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __iter__(self):
+        return (key for key in self.__slots__ if hasattr(self, key))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def copy(self):
+        """
+        Generates a dict copy of the cache values
+        :return: Map containing the cache values
+        """
+        return dict(self)
+
+
+CACHE_VALUES = CacheValues(settings=MassPaymentsSettings())
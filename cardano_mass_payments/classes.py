@@ -1,24 +1,37 @@
 import enum
-import json
+import sys
 import uuid
+from dataclasses import dataclass
+
+import orjson
 
 from .constants.common import (
+    PENDING_TRANSACTION_STATUSES,
     CardanoNetwork,
     DustCollectionMethod,
     ScriptMethod,
     TransactionStatus,
 )
 
+# Value to member maps used when loading enum fields from the transaction plan file
+_CARDANO_NETWORK_MAP = {network.value: network for network in CardanoNetwork}
+_DUST_COLLECTION_METHOD_MAP = {
+    dust_method.value: dust_method for dust_method in DustCollectionMethod
+}
+_SCRIPT_METHOD_MAP = {method.value: method for method in ScriptMethod}
+_TRANSACTION_STATUS_MAP = {status.value: status for status in TransactionStatus}
 
-class TransactionPlanEncoder(json.JSONEncoder):
-    """
-    JSON Encoder for Transaction Plan Objects
+
+def _plan_to_primitive(o):
     """
+    Converts Transaction Plan Objects to values that orjson can serialize
 
-    def default(self, o):
-        if isinstance(o, enum.Enum):
-            return o.value
-        return o.__dict__
+    :param o: Object not natively supported by orjson
+    :return: Serializable value of the object
+    """
+    if isinstance(o, enum.Enum):
+        return o.value
+    return {name: getattr(o, name) for name in o.__slots__ if not name.startswith("_")}
 
 
 class InputUTXO:
@@ -32,6 +45,8 @@ class InputUTXO:
     :param dust_collected_utxo: Flag whether the Input UTxO is created via dust collection
     """
 
+    __slots__ = ("address", "tx_hash", "tx_index", "amount", "dust_collected_utxo")
+
     def __init__(self, address, tx_hash, tx_index, amount, dust_collected_utxo=False):
         self.address = address
         self.tx_hash = tx_hash
@@ -39,18 +54,52 @@ class InputUTXO:
         self.amount = amount
         self.dust_collected_utxo = dust_collected_utxo
 
+    @classmethod
+    def from_dict(cls, input_details):
+        """
+        Generates an InputUTXO object from its transaction plan file map
+
+        :param input_details: Map containing the Input UTxO Details
+        :return: InputUTXO object
+        """
+        # Addresses and hashes repeat throughout a plan, so share one string object
+        return cls(
+            address=sys.intern(input_details["address"]),
+            tx_hash=sys.intern(input_details["tx_hash"]),
+            tx_index=input_details["tx_index"],
+            amount=input_details["amount"],
+            dust_collected_utxo=input_details.get("dust_collected_utxo", False),
+        )
+
 
+@dataclass(frozen=True)
 class PaymentDetail:
     """
     Class for Transaction Payment Details
+    Payment details are never modified once created, so the class is frozen
+    and compared by value.
 
     :param address: Target Address
     :param amount: Payment Amount in Lovelace
     """
 
-    def __init__(self, address, amount):
-        self.address = address
-        self.amount = amount
+    __slots__ = ("address", "amount")
+
+    address: str
+    amount: int
+
+    @classmethod
+    def from_dict(cls, payment_details):
+        """
+        Generates a PaymentDetail object from its transaction plan file map
+
+        :param payment_details: Map containing the Payment Details
+        :return: PaymentDetail object
+        """
+        return cls(
+            address=sys.intern(payment_details["address"]),
+            amount=payment_details["amount"],
+        )
 
 
 class PreparationDetail:
@@ -62,24 +111,57 @@ class PreparationDetail:
     :param submission_status: Preparation Transaction submission status
     :param tx_hash_id: Hash String of the Preparation Transaction
     :param withdrawal_amount: Withdrawal Amount in Lovelace
+    :param reward_details: Map containing reward details
     """
 
+    __slots__ = (
+        "prep_input",
+        "prep_output",
+        "reward_details",
+        "submission_status",
+        "tx_hash_id",
+    )
+
     def __init__(
         self,
         prep_input,
         prep_output,
         submission_status=None,
         tx_hash_id="",
-        reward_details={},
+        reward_details=None,
     ):
         self.prep_input = prep_input
         self.prep_output = prep_output
-        self.reward_details = reward_details
+        self.reward_details = {} if reward_details is None else reward_details
         self.submission_status = (
             submission_status or TransactionStatus.NOT_YET_SUBMITTED
         )
         self.tx_hash_id = tx_hash_id
 
+    @classmethod
+    def from_dict(cls, prep_details):
+        """
+        Generates a PreparationDetail object from its transaction plan file map
+
+        :param prep_details: Map containing the Preparation Transaction Details
+        :return: PreparationDetail object
+        """
+        return cls(
+            prep_input=[
+                InputUTXO.from_dict(prep_input)
+                for prep_input in prep_details["prep_input"]
+            ],
+            prep_output=[
+                PaymentDetail.from_dict(prep_output)
+                for prep_output in prep_details["prep_output"]
+            ],
+            submission_status=_TRANSACTION_STATUS_MAP[
+                prep_details["submission_status"]
+            ],
+            tx_hash_id=prep_details["tx_hash_id"],
+            reward_details=prep_details.get("reward_details", {}),
+        )
+
 
 class PaymentGroup:
     """
@@ -94,6 +176,16 @@ class PaymentGroup:
     :param tx_hash_id: Hash String of the Payment Group Transaction
     """
 
+    __slots__ = (
+        "payment_details",
+        "amount",
+        "fee",
+        "tx_size",
+        "index",
+        "submission_status",
+        "tx_hash_id",
+    )
+
     def __init__(
         self,
         index,
@@ -104,7 +196,7 @@ class PaymentGroup:
         submission_status=None,
         tx_hash_id="",
     ):
-        self.payment_details = payment_details or []
+        self.payment_details = [] if payment_details is None else payment_details
         self.amount = amount or 0
         self.fee = fee or 0
         self.tx_size = tx_size or 0
@@ -114,6 +206,29 @@ class PaymentGroup:
         )
         self.tx_hash_id = tx_hash_id
 
+    @classmethod
+    def from_dict(cls, group_details):
+        """
+        Generates a PaymentGroup object from its transaction plan file map
+
+        :param group_details: Map containing the Payment Group Details
+        :return: PaymentGroup object
+        """
+        return cls(
+            index=group_details["index"],
+            payment_details=[
+                PaymentDetail.from_dict(group_payment)
+                for group_payment in group_details["payment_details"]
+            ],
+            amount=group_details["amount"],
+            fee=group_details["fee"],
+            tx_size=group_details["tx_size"],
+            submission_status=_TRANSACTION_STATUS_MAP[
+                group_details["submission_status"]
+            ],
+            tx_hash_id=group_details["tx_hash_id"],
+        )
+
 
 class SourceAddressDetail:
     """
@@ -124,11 +239,39 @@ class SourceAddressDetail:
     :param is_main_source_address: Flag whether the address is the main source address or not
     """
 
+    __slots__ = ("address", "signing_key_file", "is_main_source_address")
+
     def __init__(self, address, signing_key_file, is_main_source_address=False):
         self.address = address
         self.signing_key_file = signing_key_file
         self.is_main_source_address = is_main_source_address
 
+    @classmethod
+    def from_dict(cls, source_details):
+        """
+        Generates a SourceAddressDetail object from its transaction plan file map
+
+        :param source_details: Map containing the Source Address Details
+        :return: SourceAddressDetail object
+        """
+        return cls(**source_details)
+
+
+def _parse_dust_groups(dust_group_details):
+    """
+    Generates the Dust Group Details from its transaction plan file map
+
+    :param dust_group_details: Map of target address to the list of dust transaction maps
+    :return: Map of target address to the list of PreparationDetail objects
+    """
+    return {
+        target_address: [
+            PreparationDetail.from_dict(dust_prep_detail)
+            for dust_prep_detail in dust_prep_details
+        ]
+        for target_address, dust_prep_details in dust_group_details.items()
+    }
+
 
 class TransactionPlan:
     """
@@ -149,6 +292,22 @@ class TransactionPlan:
     :param uuid_str: Transction Plan UUID String
     """
 
+    __slots__ = (
+        "uuid",
+        "prep_detail",
+        "group_details",
+        "metadata",
+        "network",
+        "script_method",
+        "allowed_ttl_slots",
+        "source_details",
+        "add_change_to_fee",
+        "dust_group_details",
+        "dust_collection_method",
+        "dust_collection_threshold",
+        "filename",
+    )
+
     def __init__(
         self,
         prep_detail,
@@ -176,7 +335,9 @@ class TransactionPlan:
         self.allowed_ttl_slots = allowed_ttl_slots
         self.source_details = source_details
         self.add_change_to_fee = add_change_to_fee
-        self.dust_group_details = dust_group_details or {}
+        self.dust_group_details = (
+            {} if dust_group_details is None else dust_group_details
+        )
         self.dust_collection_method = dust_collection_method
         self.dust_collection_threshold = dust_collection_threshold
         self.filename = filename or f"{self.uuid}_transaction_plan.json"
@@ -189,134 +350,82 @@ class TransactionPlan:
         :param transaction_plan_filename: Name of the Transaction plan file
         :return: TransctionPlan object containing details from the transaction plan file
         """
-        with open(transaction_plan_filename, "r") as transaction_plan_file:
-            transaction_plan_details = json.loads(transaction_plan_file.read())
-            prep_details = transaction_plan_details.get("prep_detail", {})
-
-            transaction_plan = cls(
-                uuid_str=transaction_plan_details.get("uuid"),
-                prep_detail=PreparationDetail(
-                    prep_input=[
-                        InputUTXO(
-                            address=prep_input.get("address"),
-                            tx_hash=prep_input.get("tx_hash"),
-                            tx_index=prep_input.get("tx_index"),
-                            amount=prep_input.get("amount"),
-                            dust_collected_utxo=prep_input.get("dust_collected_utxo"),
-                        )
-                        for prep_input in prep_details.get("prep_input", [])
-                    ],
-                    prep_output=[
-                        PaymentDetail(
-                            address=prep_output.get("address"),
-                            amount=prep_output.get("amount"),
-                        )
-                        for prep_output in prep_details.get("prep_output", [])
-                    ],
-                    submission_status=TransactionStatus(
-                        prep_details.get("submission_status"),
-                    ),
-                    tx_hash_id=prep_details.get("tx_hash_id"),
-                    reward_details=prep_details.get("reward_details", {}),
-                ),
-                group_details=[
-                    PaymentGroup(
-                        index=payment_group.get("index"),
-                        payment_details=[
-                            PaymentDetail(
-                                address=group_payment.get("address"),
-                                amount=group_payment.get("amount"),
-                            )
-                            for group_payment in payment_group.get(
-                                "payment_details",
-                                [],
-                            )
-                        ],
-                        amount=payment_group.get("amount"),
-                        fee=payment_group.get("fee"),
-                        tx_size=payment_group.get("tx_size"),
-                        submission_status=TransactionStatus(
-                            payment_group.get("submission_status"),
-                        ),
-                        tx_hash_id=payment_group.get("tx_hash_id"),
-                    )
-                    for payment_group in transaction_plan_details.get(
-                        "group_details",
-                        [],
-                    )
-                ],
-                metadata=transaction_plan_details.get("metadata"),
-                network=CardanoNetwork(transaction_plan_details.get("network")),
-                script_method=ScriptMethod(
-                    transaction_plan_details.get("script_method"),
-                ),
-                allowed_ttl_slots=transaction_plan_details.get("allowed_ttl_slots"),
-                source_details=[
-                    SourceAddressDetail(
-                        address=source_detail.get("address"),
-                        signing_key_file=source_detail.get("signing_key_file"),
-                        is_main_source_address=source_detail.get(
-                            "is_main_source_address",
-                        ),
-                    )
-                    for source_detail in transaction_plan_details.get("source_details")
-                ],
-                add_change_to_fee=transaction_plan_details.get("add_change_to_fee"),
-                dust_collection_method=DustCollectionMethod(
-                    transaction_plan_details.get("dust_collection_method"),
-                ),
-                dust_collection_threshold=transaction_plan_details.get(
-                    "dust_collection_threshold",
-                ),
-                filename=transaction_plan_filename,
-            )
-
-        if transaction_plan_details.get("dust_group_details"):
-            dust_group_details = transaction_plan_details.get("dust_group_details")
-            transaction_plan.dust_group_details = {}
-            for target_address in dust_group_details:
-                formatted_dust_group_details = [
-                    PreparationDetail(
-                        prep_input=[
-                            InputUTXO(
-                                address=dust_input_detail.get("address"),
-                                tx_hash=dust_input_detail.get("tx_hash"),
-                                tx_index=dust_input_detail.get("tx_index"),
-                                amount=dust_input_detail.get("amount"),
-                                dust_collected_utxo=dust_input_detail.get(
-                                    "dust_collected_utxo",
-                                ),
-                            )
-                            for dust_input_detail in dust_prep_detail.get("prep_input")
-                        ],
-                        prep_output=[
-                            PaymentDetail(
-                                address=dust_payment_detail.get("address"),
-                                amount=dust_payment_detail.get("amount"),
-                            )
-                            for dust_payment_detail in dust_prep_detail.get(
-                                "prep_output",
-                            )
-                        ],
-                        submission_status=TransactionStatus(
-                            dust_prep_detail.get("submission_status"),
-                        ),
-                        tx_hash_id=dust_prep_detail.get("tx_hash_id"),
-                    )
-                    for dust_prep_detail in dust_group_details.get(target_address)
-                ]
-                transaction_plan.dust_group_details[
-                    target_address
-                ] = formatted_dust_group_details
-
-        return transaction_plan
+        with open(transaction_plan_filename, "rb") as transaction_plan_file:
+            transaction_plan_details = orjson.loads(transaction_plan_file.read())
+
+        return cls(
+            uuid_str=transaction_plan_details["uuid"],
+            prep_detail=PreparationDetail.from_dict(
+                transaction_plan_details["prep_detail"],
+            ),
+            group_details=[
+                PaymentGroup.from_dict(payment_group)
+                for payment_group in transaction_plan_details["group_details"]
+            ],
+            metadata=transaction_plan_details.get("metadata"),
+            network=_CARDANO_NETWORK_MAP[transaction_plan_details["network"]],
+            script_method=_SCRIPT_METHOD_MAP[transaction_plan_details["script_method"]],
+            allowed_ttl_slots=transaction_plan_details["allowed_ttl_slots"],
+            source_details=[
+                SourceAddressDetail.from_dict(source_detail)
+                for source_detail in transaction_plan_details["source_details"]
+            ],
+            add_change_to_fee=transaction_plan_details["add_change_to_fee"],
+            dust_group_details=_parse_dust_groups(
+                transaction_plan_details.get("dust_group_details") or {},
+            ),
+            dust_collection_method=_DUST_COLLECTION_METHOD_MAP[
+                transaction_plan_details["dust_collection_method"]
+            ],
+            dust_collection_threshold=transaction_plan_details[
+                "dust_collection_threshold"
+            ],
+            filename=transaction_plan_filename,
+        )
+
+    def json_bytes(self):
+        """
+        Generates the UTF-8 encoded JSON of the Transaction Plan
+        :return: JSON Bytes of the Transaction Plan
+        """
+        return orjson.dumps(
+            self,
+            default=_plan_to_primitive,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
 
     def json(self):
         """
         Generates the JSON String of the Transaction Plan
         :return: JSON String of the Transaction Plan
         """
-        return TransactionPlanEncoder().encode(self)
+        return self.json_bytes().decode()
+
+    def amount_totals(self):
+        """
+        Gets the total input and payment amounts of the Transaction Plan
+        :return: Tuple containing the total input amount and the total payment amount
+        """
+        total_input_tx_amount = 0
+        for dust_group_detail_list in self.dust_group_details.values():
+            for dust_group_detail in dust_group_detail_list:
+                for dust_input in dust_group_detail.prep_input:
+                    if not dust_input.dust_collected_utxo:
+                        total_input_tx_amount += dust_input.amount
+
+        total_input_tx_amount += sum(
+            prep_input.amount
+            for prep_input in self.prep_detail.prep_input
+            if not prep_input.dust_collected_utxo
+        )
+
+        total_payment_amount = sum(
+            prep_output.amount
+            for prep_output in self.prep_detail.prep_output
+            if isinstance(prep_output.amount, int)
+        )
+
+        return total_input_tx_amount, total_payment_amount
 
     def general_transaction_details(self):
         """
@@ -329,48 +438,20 @@ class TransactionPlan:
             - Expected Maximum Change Return
         """
 
-        # Count Dust Groups Created
+        # Count Pending Dust Transactions and Transaction Groups
         dust_tx_count = 0
-        total_input_tx_amount = 0
-        tx_group_count = 0
-        for target_address in self.dust_group_details:
-            for dust_group_detail in self.dust_group_details[target_address]:
-                dust_input_list = dust_group_detail.prep_input
-                total_input_tx_amount += sum(
-                    [
-                        dust_input.amount
-                        for dust_input in dust_input_list
-                        if not dust_input.dust_collected_utxo
-                    ],
-                )
-                if dust_group_detail.submission_status in [
-                    TransactionStatus.NOT_YET_SUBMITTED,
-                    TransactionStatus.TTL_EXPIRED,
-                ]:
+        for dust_group_detail_list in self.dust_group_details.values():
+            for dust_group_detail in dust_group_detail_list:
+                if dust_group_detail.submission_status in PENDING_TRANSACTION_STATUSES:
                     dust_tx_count += 1
 
-        for tx_group in self.group_details:
-            if tx_group.submission_status in [
-                TransactionStatus.NOT_YET_SUBMITTED,
-                TransactionStatus.TTL_EXPIRED,
-            ]:
-                tx_group_count += 1
-
-        total_input_tx_amount += sum(
-            [
-                prep_input.amount
-                for prep_input in self.prep_detail.prep_input
-                if not prep_input.dust_collected_utxo
-            ],
+        tx_group_count = sum(
+            1
+            for tx_group in self.group_details
+            if tx_group.submission_status in PENDING_TRANSACTION_STATUSES
         )
 
-        total_payment_amount = sum(
-            [
-                prep_output.amount
-                for prep_output in self.prep_detail.prep_output
-                if isinstance(prep_output.amount, int)
-            ],
-        )
+        total_input_tx_amount, total_payment_amount = self.amount_totals()
 
         return (
             f"Transaction File Name: {self.filename}\n"
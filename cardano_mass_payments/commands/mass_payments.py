@@ -1,10 +1,11 @@
 import argparse
-import copy
 import json
 import os
-import traceback
+import sys
 import uuid
 
+import orjson
+
 from ..cache import CACHE_VALUES
 from ..classes import SourceAddressDetail, TransactionPlan
 from ..constants.common import (
@@ -21,8 +22,12 @@ from ..constants.exceptions import (
     ScriptError,
 )
 from ..utils.cli_utils import create_file_copy_in_docker_container, delete_temp_file
-from ..utils.common import print_to_console, subprocess_popen
-from ..utils.pycardano_utils import CardanoCLIChainContext
+from ..utils.common import (
+    get_script_settings,
+    print_to_console,
+    subprocess_popen,
+    write_file_atomically,
+)
 from ..utils.script_utils import (
     adjust_utxos,
     dust_collect,
@@ -32,79 +37,97 @@ from ..utils.script_utils import (
 )
 
 
+def split_metadata_message_line(message_line, max_bytes=64):
+    """
+    Function that splits a metadata message line based on the maximum bytes
+
+    :param message_line: Metadata Message Line
+    :param max_bytes: Maximum Bytes Required for each Metadata Message
+    :return: Generator of Metadata Messages that follows the maximum byte size
+    """
+    if len(message_line.encode("utf-8")) <= max_bytes:
+        yield message_line
+        return
+
+    adjusted_line_list = []
+    line_byte_size = 0
+    for message_word in message_line.split(" "):
+        word_bytes = message_word.encode("utf-8")
+        while True:
+            # Words after the first one are preceded by a space
+            separator_size = 1 if adjusted_line_list else 0
+            word_byte_size = separator_size + len(word_bytes)
+            if line_byte_size + word_byte_size <= max_bytes:
+                adjusted_line_list.append(message_word)
+                line_byte_size += word_byte_size
+                break
+
+            # Cut the word at the last UTF-8 character boundary that still fits
+            cut_index = max(max_bytes - line_byte_size - separator_size, 0)
+            while cut_index > 0 and (word_bytes[cut_index] & 0xC0) == 0x80:
+                cut_index -= 1
+            if cut_index > 0:
+                adjusted_line_list.append(word_bytes[:cut_index].decode("utf-8"))
+                word_bytes = word_bytes[cut_index:]
+                message_word = word_bytes.decode("utf-8")
+
+            # The line is full, continue the word in the next line
+            if adjusted_line_list:
+                yield " ".join(adjusted_line_list)
+            adjusted_line_list = []
+            line_byte_size = 0
+            if not word_bytes or (cut_index == 0 and separator_size == 0):
+                # Empty words are not carried over, and words whose first character
+                # is bigger than the maximum bytes are dropped
+                break
+
+    if adjusted_line_list:
+        yield " ".join(adjusted_line_list)
+
+
 def adjust_metadata_message(metadata_message, max_bytes=64):
     """
     Function that adjust the metadata message based on the maximum bytes
 
-    :param metadata_message: Metadata Message String
+    :param metadata_message: Iterable of Metadata Message Lines
     :param max_bytes: Maximum Bytes Required for each Metadata Message
     :return: List of Metadata Messages that follows the maximum byte size
     """
-    adjusted_metadata_message = []
+    return [
+        adjusted_line
+        for message_line in metadata_message
+        for adjusted_line in split_metadata_message_line(message_line, max_bytes)
+    ]
 
-    metadata_message_list = copy.deepcopy(metadata_message)
 
-    line_index = 0
-    for message_line in metadata_message_list:
-        if len(message_line.encode("utf-8")) <= max_bytes:
-            adjusted_metadata_message.append(message_line)
-        else:
-            # Per Word
-            adjusted_line_list = []
-            extras_list = []
-            message_words = message_line.split(" ")
-            limit_reached = False
-            for message_word in message_words:
-                adjusted_line = " ".join(adjusted_line_list + [message_word])
-                if len(adjusted_line.encode("utf-8")) <= max_bytes:
-                    adjusted_line_list.append(message_word)
-                elif not limit_reached:
-                    # Per Character
-                    final_char_index = -1
-                    for char_index in range(len(message_word)):
-                        adjusted_line = " ".join(
-                            adjusted_line_list + [message_word[: char_index + 1]],
-                        )
-                        if len(adjusted_line.encode("utf-8")) <= max_bytes:
-                            final_char_index = char_index
-                        else:
-                            # It is now at limit
-                            limit_reached = True
-                            break
-                    # Add the adjusted word in adjusted line list
-                    if final_char_index >= 0:
-                        temp_char_index = final_char_index + 1
-                        adjusted_line_list.append(message_word[:temp_char_index])
-                        extras_list.append(message_word[temp_char_index:])
-                else:
-                    extras_list.append(message_word)
-            adjusted_metadata_message.append(" ".join(adjusted_line_list))
-            if extras_list:
-                metadata_message_list.insert(line_index + 1, " ".join(extras_list))
-        line_index += 1
-
-    return adjusted_metadata_message
-
-
-def get_source_details(args, transaction_plan):
+def get_source_details(args, transaction_plan, output_format):
     """
     Gets the source address and signing key file from command arguments/transaction plan
 
     :param args: Command Arguments
     :param transaction_plan: TransactionPlan object
+    :param output_format: Script Output Format
     :return: Tuple containing source address, signing key file, and source details
     """
     source_address = args.source_address
     signing_key_file = args.source_signing_key_file
-    output_format = ScriptOutputFormats(args.output_type)
 
     if transaction_plan and transaction_plan.source_details:
-        source_details = {}
-        for source_detail in transaction_plan.source_details:
-            source_details[source_detail.address] = source_detail.signing_key_file
-            if source_detail.is_main_source_address:
-                source_address = source_detail.address
-                signing_key_file = source_detail.signing_key_file
+        source_details = {
+            source_detail.address: source_detail.signing_key_file
+            for source_detail in transaction_plan.source_details
+        }
+        main_source_detail = next(
+            (
+                source_detail
+                for source_detail in transaction_plan.source_details
+                if source_detail.is_main_source_address
+            ),
+            None,
+        )
+        if main_source_detail:
+            source_address = main_source_detail.address
+            signing_key_file = main_source_detail.signing_key_file
     else:
         source_details = parse_sources_csv_file(args.sources_csv)
 
@@ -119,10 +142,11 @@ def get_source_details(args, transaction_plan):
         )
 
     if signing_key_file:
-        if isinstance(signing_key_file, list):
-            source_details[source_address] = signing_key_file
-        else:
-            source_details[source_address] = [signing_key_file]
+        source_details[source_address] = (
+            signing_key_file
+            if isinstance(signing_key_file, list)
+            else [signing_key_file]
+        )
     elif source_details.get(source_address):
         signing_key_file = source_details.get(source_address)
         print_to_console(
@@ -138,66 +162,68 @@ def get_source_details(args, transaction_plan):
     return source_address, signing_key_file, source_details
 
 
-def get_metadata_details(args, transaction_plan, metadata_json_filename):
+def get_metadata_details(
+    args,
+    transaction_plan,
+    metadata_json_filename,
+    output_format,
+    script_method,
+):
     """
     Get and set metadata details on cache
 
     :param args: Command Arguments
     :param transaction_plan: TransactionPlan object
     :param metadata_json_filename: Metadata JSON template filename
-    :return: updated metadata json filename
+    :param output_format: Script Output Format
+    :param script_method: Method used in the script logic
+    :return: Tuple containing the updated metadata json filename and metadata details
     """
-    output_format = ScriptOutputFormats(args.output_type)
-    script_method = (
-        transaction_plan.script_method
-        if transaction_plan
-        else ScriptMethod(args.script_method)
-    )
-
     # Check Metadata JSON File
     metadata_json_details = None
     if metadata_json_filename:
         # Check if json file is json loadable
         with open(metadata_json_filename, "r") as metadata_json_file:
             try:
-                metadata_json_details = json.loads(metadata_json_file.read())
+                metadata_json_details = json.load(metadata_json_file)
             except Exception:
                 print_to_console(
                     "Invalid metadata json file. Please make sure that the file is correct.",
                     output_format,
                 )
-                return
+                return None, None
 
     metadata_message_filename = args.metadata_message_file
     if metadata_message_filename:
         with open(metadata_message_filename, "r") as metadata_message_file:
-            metadata_message = metadata_message_file.read().split("\n")
+            metadata_message = [
+                message_line.rstrip("\n") for message_line in metadata_message_file
+            ]
         metadata_json_details = metadata_json_details or {}
         metadata_json_details.update(
             {"674": {"msg": adjust_metadata_message(metadata_message)}},
         )
         # Create a new metadata file
         if metadata_json_filename is None:
-            metadata_message_file_str_split = os.path.split(metadata_message_filename)
-            metadata_message_dir = metadata_message_file_str_split[0]
-            metadata_json_filename = f"{uuid.uuid4().hex}_metadata.json"
-            if metadata_message_dir != "":
-                metadata_json_filename = (
-                    f"{metadata_message_dir}/{metadata_json_filename}"
-                )
-        metadata_json_file_str_split = os.path.split(metadata_json_filename)
-        metadata_json_dir = metadata_json_file_str_split[0]
-        metadata_json_filename = f"new_{metadata_json_file_str_split[1]}"
-        if metadata_json_dir != "":
-            metadata_json_filename = f"{metadata_json_dir}/{metadata_json_filename}"
+            metadata_json_filename = os.path.join(
+                os.path.dirname(metadata_message_filename),
+                f"{uuid.uuid4().hex}_metadata.json",
+            )
+        metadata_json_dir, metadata_json_name = os.path.split(metadata_json_filename)
+        metadata_json_filename = os.path.join(
+            metadata_json_dir,
+            f"new_{metadata_json_name}",
+        )
         if transaction_plan and transaction_plan.metadata:
             metadata_json_filename = f"{transaction_plan.uuid}_metadata.json"
         print_to_console(
             f"Generated a new metadata file to incorporate the metadata message '{metadata_json_filename}'",
             output_format=output_format,
         )
-        with open(metadata_json_filename, "w+") as metadata_json_file:
-            metadata_json_file.write(json.dumps(metadata_json_details))
+        write_file_atomically(
+            metadata_json_filename,
+            orjson.dumps(metadata_json_details),
+        )
 
     if metadata_json_filename:
         # Create a temp copy in docker container if method == DOCKER_CLI
@@ -206,11 +232,25 @@ def get_metadata_details(args, transaction_plan, metadata_json_filename):
             metadata_copy_filename = create_file_copy_in_docker_container(
                 metadata_json_filename,
             )
-        CACHE_VALUES[
-            "metadata_file"
-        ] = metadata_copy_filename  # Update the source signing key file cache value
+        # Update the metadata file cache value
+        CACHE_VALUES.metadata_file = metadata_copy_filename
 
-    return metadata_json_filename
+    return metadata_json_filename, metadata_json_details
+
+
+def parse_enum_argument(enum_class, value, invalid_value_error):
+    """
+    Converts a command argument value into its enum member
+
+    :param enum_class: Enum class of the argument
+    :param value: Command argument value
+    :param invalid_value_error: ScriptError class raised when the value is invalid
+    :return: Enum member of the command argument value
+    """
+    try:
+        return enum_class(value)
+    except ValueError:
+        raise invalid_value_error(value)
 
 
 def get_command_parameters(args):
@@ -223,11 +263,9 @@ def get_command_parameters(args):
 
     # Create Preparation TX Details
     output_format = ScriptOutputFormats(args.output_type)
-    CACHE_VALUES["output_format"] = output_format
+    CACHE_VALUES.output_format = output_format
     metadata_json_filename = args.metadata_json_file
 
-    # Update Settings
-
     transaction_plan = None
     if args.transaction_plan_file:
         print_to_console("Transaction Plan Found, Parsing...", output_format)
@@ -244,38 +282,39 @@ def get_command_parameters(args):
                 file=args.transaction_plan_file,
                 message="Error during Parsing Transaction Plan File.",
                 error=e,
-                traceback=traceback.format_exc(),
+                traceback=sys.exc_info(),
             )
 
         if transaction_plan.metadata:
             metadata_json_filename = f"{transaction_plan.uuid}_metadata.json"
-            with open(metadata_json_filename, "w+") as metadata_json_file:
-                metadata_json_file.write(json.dumps(transaction_plan.metadata))
+            write_file_atomically(
+                metadata_json_filename,
+                orjson.dumps(transaction_plan.metadata),
+            )
 
-    try:
-        cardano_network = (
-            transaction_plan.network
-            if transaction_plan
-            else CardanoNetwork(args.cardano_network)
+    if transaction_plan:
+        cardano_network = transaction_plan.network
+        script_method = transaction_plan.script_method
+    else:
+        cardano_network = parse_enum_argument(
+            CardanoNetwork,
+            args.cardano_network,
+            InvalidNetwork,
         )
-    except ValueError:
-        raise InvalidNetwork(network=args.cardano_network)
-
-    try:
-        script_method = (
-            transaction_plan.script_method
-            if transaction_plan
-            else ScriptMethod(args.script_method)
+        script_method = parse_enum_argument(
+            ScriptMethod,
+            args.script_method,
+            InvalidMethod,
         )
-    except ValueError:
-        raise InvalidMethod(method=args.script_method)
 
-    if args.magic_number != -1:
-        CACHE_VALUES["settings"].cardano_testnet_magic = args.magic_number
-    else:
-        CACHE_VALUES["settings"].cardano_testnet_magic = MAGIC_NUMBER_MAP[args.cardano_network]
-
-    CACHE_VALUES["settings"].cardano_node_docker_image_name = args.cardano_node_docker_image
+    # Update Settings
+    script_settings = get_script_settings()
+    script_settings.cardano_testnet_magic = (
+        args.magic_number
+        if args.magic_number != -1
+        else MAGIC_NUMBER_MAP[cardano_network.value]
+    )
+    script_settings.cardano_node_docker_image_name = args.cardano_node_docker_image
 
     if script_method == ScriptMethod.METHOD_PYCARDANO:
         if args.include_rewards:
@@ -285,7 +324,9 @@ def get_command_parameters(args):
             )
 
         # Create pycardano context object
-        CACHE_VALUES["pycardano_context"] = CardanoCLIChainContext(
+        from ..utils.pycardano_utils import CardanoCLIChainContext
+
+        CACHE_VALUES.pycardano_context = CardanoCLIChainContext(
             cardano_network=cardano_network,
             use_docker_cli=args.use_docker_cli_for_pycardano,
         )
@@ -304,6 +345,7 @@ def get_command_parameters(args):
         source_address, signing_key_file, source_details = get_source_details(
             args,
             transaction_plan,
+            output_format,
         )
     except FileNotFoundError as e:
         raise InvalidFileError(
@@ -311,18 +353,17 @@ def get_command_parameters(args):
             message="Source File does not exist.",
         )
 
-    CACHE_VALUES[
-        "source_address"
-    ] = source_address  # Update the source address cache value
-    CACHE_VALUES[
-        "source_signing_key_file"
-    ] = signing_key_file  # Update the source signing key file cache value
+    # Update the source address and source signing key file cache values
+    CACHE_VALUES.source_address = source_address
+    CACHE_VALUES.source_signing_key_file = signing_key_file
 
     try:
-        metadata_json_filename = get_metadata_details(
+        metadata_json_filename, metadata_json_details = get_metadata_details(
             args,
             transaction_plan,
             metadata_json_filename,
+            output_format,
+            script_method,
         )
     except Exception as e:
         error_filename = metadata_json_filename or args.metadata_message_file
@@ -332,7 +373,7 @@ def get_command_parameters(args):
             file=error_filename,
             message="Error while getting metadata details",
             error=e,
-            traceback=traceback.format_exc(),
+            traceback=sys.exc_info(),
         )
 
     # Dust collection details
@@ -350,6 +391,7 @@ def get_command_parameters(args):
         "script_method": script_method,
         "allowed_ttl_slots": allowed_ttl_slots,
         "metadata_json_filename": metadata_json_filename,
+        "metadata_json_details": metadata_json_details,
         "store_in_file": store_in_file,
         "add_comments": args.add_comments,
         "payments_csv_file": args.payments_csv,
@@ -445,10 +487,10 @@ def generate_transaction_plan(
     transaction_plan.source_details = [
         SourceAddressDetail(
             address=source_detail_key,
-            signing_key_file=source_details[source_detail_key],
+            signing_key_file=source_signing_key_files,
             is_main_source_address=(source_detail_key == source_address),
         )
-        for source_detail_key in source_details
+        for source_detail_key, source_signing_key_files in source_details.items()
     ]
 
     return transaction_plan
@@ -457,6 +499,22 @@ def generate_transaction_plan(
 def generate_script_process(args):
     """
     Main process of generating the masspayments script
+    cardano-cli query results are cached only for the duration of the run
+
+    :param args: Command Argument Parameters
+    :return: TransactionPlan object record
+    """
+    script_settings = get_script_settings()
+    script_settings.enable_query_cache()
+    try:
+        return run_script_process(args)
+    finally:
+        script_settings.reset_query_cache()
+
+
+def run_script_process(args):
+    """
+    Generates the masspayments script from the command arguments
 
     :param args: Command Argument Parameters
     :return: TransactionPlan object record
@@ -492,15 +550,14 @@ def generate_script_process(args):
         else command_parameters.get("transaction_plan_file")
     )
     if metadata_json_filename:
-        with open(metadata_json_filename, "r") as metadata_json_file:
-            transaction_plan.metadata = json.loads(metadata_json_file.read())
+        # Reuse the metadata parsed while getting the command parameters
+        transaction_plan.metadata = command_parameters.get("metadata_json_details")
 
     # Create Transaction Plan File
     transaction_plan_filename = (
         transaction_plan.filename or f"{transaction_plan.uuid}_transaction_plan.json"
     )
-    with open(transaction_plan_filename, "w+") as transaction_plan_file:
-        transaction_plan_file.write(transaction_plan.json())
+    write_file_atomically(transaction_plan_filename, transaction_plan.json_bytes())
 
     if output_format == ScriptOutputFormats.TRANSACTION_PLAN:
         print_to_console(
@@ -523,13 +580,9 @@ def generate_script_process(args):
         method=script_method,
     )
 
-    if script_method == ScriptMethod.METHOD_DOCKER_CLI and CACHE_VALUES.get(
-        "metadata_file",
-    ):
-        delete_temp_file(
-            filename=CACHE_VALUES.get("metadata_file"),
-            method=script_method,
-        )
+    metadata_copy_filename = CACHE_VALUES.metadata_file
+    if script_method == ScriptMethod.METHOD_DOCKER_CLI and metadata_copy_filename:
+        delete_temp_file(filename=metadata_copy_filename, method=script_method)
 
     if output_format == ScriptOutputFormats.BASH_SCRIPT:
         print_to_console(
@@ -577,6 +630,26 @@ def generate_script_process(args):
     return transaction_plan
 
 
+def enum_argument_type(enum_class):
+    """
+    Generates an argparse type function that converts the argument into an enum member
+
+    :param enum_class: Enum class of the argument
+    :return: Function that returns the enum member of the argument value
+    """
+
+    def convert_argument(value):
+        try:
+            return enum_class(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"invalid choice: '{value}' (choose from "
+                f"{', '.join(member.value for member in enum_class)})",
+            )
+
+    return convert_argument
+
+
 def main():
     parser = argparse.ArgumentParser()
 
@@ -588,19 +661,22 @@ def main():
         "--cardano-network",
         help="Network which the script will connect to",
         default=CardanoNetwork.PREPROD.value,
-        choices=[cn.value for cn in CardanoNetwork],
+        type=enum_argument_type(CardanoNetwork),
+        metavar="{" + ",".join(cn.value for cn in CardanoNetwork) + "}",
     )
     parser.add_argument(
         "--script-method",
         help="Method that will be used in generating the script",
         default=ScriptMethod.METHOD_DOCKER_CLI.value,
-        choices=[cf.value for cf in ScriptMethod],
+        type=enum_argument_type(ScriptMethod),
+        metavar="{" + ",".join(cf.value for cf in ScriptMethod) + "}",
     )
     parser.add_argument(
         "--output-type",
         help="Format of the output script",
         default=ScriptOutputFormats.JSON.value,
-        choices=[sof.value for sof in ScriptOutputFormats],
+        type=enum_argument_type(ScriptOutputFormats),
+        metavar="{" + ",".join(sof.value for sof in ScriptOutputFormats) + "}",
     )
     parser.add_argument(
         "--sources-csv",
@@ -669,7 +745,8 @@ def main():
         "--dust-collection-method",
         help="Method to be used for dust collection",
         default=DustCollectionMethod.COLLECT_TO_SOURCE.value,
-        choices=[dcm.value for dcm in DustCollectionMethod],
+        type=enum_argument_type(DustCollectionMethod),
+        metavar="{" + ",".join(dcm.value for dcm in DustCollectionMethod) + "}",
     )
     parser.add_argument(
         "--dust-collection-threshold",
@@ -694,15 +771,15 @@ def main():
     try:
         generate_script_process(args)
     except ScriptError as e:
-        print_to_console(e, output_format=ScriptOutputFormats(args.output_type))
+        print_to_console(e, output_format=args.output_type)
     except Exception as e:
         print_to_console(
             ScriptError(
                 message="Unexpected Error in Script Process Generation.",
                 error=e,
-                traceback=traceback.format_exc(),
+                traceback=sys.exc_info(),
             ),
-            output_format=ScriptOutputFormats(args.output_type),
+            output_format=args.output_type,
         )
 
 
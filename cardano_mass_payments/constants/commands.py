@@ -28,23 +28,37 @@ TRANSACTION_SUBMIT = (
     "{prefix}cardano-cli transaction submit --tx-file {signed_file} {network}"
 )
 
-QUERY_PROTOCOL_PARAMETERS = "{prefix}cardano-cli query protocol-parameters {network}"
-QUERY_PROTOCOL_PARAMETERS_WITH_FILE = (
-    QUERY_PROTOCOL_PARAMETERS + " --out-file {protocol_filename}"
-)
 QUERY_TIP = "{prefix}cardano-cli query tip {network}"
-QUERY_WALLET_UTXO_VIA_TXID = (
-    "{prefix}cardano-cli query utxo --tx-in {tx_hash}#{tx_index} {network}"
+QUERY_WALLET_UTXO_VIA_TX_IN_FLAGS = (
+    "{prefix}cardano-cli query utxo {tx_in_flags} {network}"
 )
 QUERY_WALLET_UTXO_NO_FILE = (
     "{prefix}cardano-cli query utxo --address {address} {network}"
 )
-QUERY_WALLET_UTXO = f"{QUERY_WALLET_UTXO_NO_FILE} --out-file {{utxo_filename}}"
+
+# Cardano command arguments for commands run directly (shell=False)
+# The command prefix arguments go before these, the command values and network flag
+# arguments after them
+QUERY_PROTOCOL_PARAMETERS_ARGS = ("cardano-cli", "query", "protocol-parameters")
+QUERY_TIP_ARGS = ("cardano-cli", "query", "tip")
+QUERY_WALLET_UTXO_ARGS = ("cardano-cli", "query", "utxo", "--address")
+TRANSACTION_FEE_ARGS = (
+    "cardano-cli",
+    "transaction",
+    "calculate-min-fee",
+    "--tx-body-file",
+)
+TRANSACTION_SIGN_ARGS = ("cardano-cli", "transaction", "sign", "--tx-body-file")
+TRANSACTION_TXID_ARGS = ("cardano-cli", "transaction", "txid", "--tx-file")
+
+# Script variable holding the docker exec prefix in the generated bash script
+DOCKER_PREFIX_VARIABLE = "CNODE"
 
 # File commands
 CHECK_TEMP_DIRECTORY = "{prefix}test ! -d '/tmp-files' && mkdir '/tmp-files'"
-READ_FILE = "{prefix}cat {filename}"
 DELETE_FILE = "{prefix}rm {filename}"
+READ_FILE_ARGS = ("cat",)
+DELETE_FILE_ARGS = ("rm",)
 
 CREATE_FILE_COPY_TO_DOCKER = (
     "sk=$(cat {source_filename}) && {prefix} /bin/bash -c "
@@ -53,9 +67,9 @@ CREATE_FILE_COPY_TO_DOCKER = (
 
 # Script commands
 STATUS_MESSAGE_SETUP = f"""
-success_str="{BashColor.BOLD_GREEN.value}SUCCESS{BashColor.NO_COLOR.value}"
-ongoing_str="{BashColor.BOLD_YELLOW.value}ONGOING{BashColor.NO_COLOR.value}"
-ttl_expired_str="{BashColor.BOLD_RED.value}TTL EXPIRED{BashColor.NO_COLOR.value}"
+success_str="{BashColor.BOLD_GREEN}SUCCESS{BashColor.NO_COLOR}"
+ongoing_str="{BashColor.BOLD_YELLOW}ONGOING{BashColor.NO_COLOR}"
+ttl_expired_str="{BashColor.BOLD_RED}TTL EXPIRED{BashColor.NO_COLOR}"
 """
 
 FIND_PYTHON_FUNCTION = """
@@ -89,17 +103,24 @@ UPDATE_TRANSACTION_PLAN_PYTHON_COMMANDS = ";".join(
         "{python_update_command}",
         "f.seek(0)",
         "f.write(json.dumps(data))",
-        "f.truncate()," "f.close()",
+        "f.truncate()",
+        "f.close()",
     ],
 )
 
+# -S skips the site module import, the update only needs the standard library
 UPDATE_TRANSACTION_PLAN_FILE = (
-    f'{{python_exec_str}} -c "{UPDATE_TRANSACTION_PLAN_PYTHON_COMMANDS}"'
+    f'{{python_exec_str}} -S -c "{UPDATE_TRANSACTION_PLAN_PYTHON_COMMANDS}"'
 )
 
 DUST_TX_SUBMIT_SCRIPT = """
 echo "Submitting Dust Transactions to Cardano"
 
+dust_txid_array=()
+dust_map_index_array=()
+dust_address_index_array=()
+dust_address_array=()
+
 dust_submit_function () {{
     straight_to_polling=${{{polling_arg_index}:-false}}
     if [[ $straight_to_polling == false ]] ; then
@@ -109,27 +130,19 @@ dust_submit_function () {{
     fi
     if [[ $dust_submit_result ]] ; then
         {ongoing_status_command}
-        dust_results=$({utxo_query_command})
-        echo -en "Status ${function_index_txid} = $ongoing_str"
-        dust_status=$ongoing_str
-        until [[ $dust_results == *${function_index_txid}* ]] || [[ $dust_status != "$ongoing_str" ]]
+        address_index=${{#dust_address_array[@]}}
+        for (( j=0; j<${{#dust_address_array[@]}}; j++ ))
         do
-            dust_results=$({utxo_query_command})
-            latest_slot=$(get_latest_slot_no)
-            if (( $latest_slot > {ttl} )) ; then
-                dust_status=$ttl_expired_str
-                {expired_status_command}
+            if [[ ${{dust_address_array[$j]}} == "$2" ]] ; then
+                address_index=$j
             fi
         done
-        if [[ $dust_status == "$ongoing_str" ]] ; then
-            dust_status=$success_str
-            {success_status_command}
-        fi
-        echo -en "\\r\\033[KStatus ${function_index_txid} = $dust_status"
-        echo
-        if [[ $dust_status != "$success_str" ]] ; then
-            exit 1
+        if (( $address_index == ${{#dust_address_array[@]}} )) ; then
+            dust_address_array+=("$2")
         fi
+        dust_txid_array+=("${function_index_txid}")
+        dust_map_index_array+=("$4")
+        dust_address_index_array+=("$address_index")
     else
         echo "There was an error when the Dust Transaction was submitted to Cardano"
         exit 1
@@ -137,6 +150,79 @@ dust_submit_function () {{
 }}
 """
 
+DUST_TX_STATUS_SCRIPT = """
+dust_length=${{#dust_txid_array[@]}}
+dust_status_array=()
+for (( i=0; i<${{dust_length}}; i++ ))
+do
+    dust_status_array+=("$ongoing_str")
+done
+
+# Highest map index confirmed so far for each target address
+dust_confirmed_array=()
+for (( j=0; j<${{#dust_address_array[@]}}; j++ ))
+do
+    dust_confirmed_array+=(-1)
+done
+
+dust_ongoing_count=$dust_length
+dust_expired_count=0
+poll_interval=2
+while (( dust_ongoing_count > 0 ))
+do
+    latest_slot=$(get_latest_slot_no)
+    # Query each target address once for all of its dust transactions
+    dust_results_array=()
+    for dust_address in "${{dust_address_array[@]}}"
+    do
+        dust_results_array+=("$({utxo_query_command})")
+    done
+    # Each dust transaction spends the output of the previous one for the same
+    # address, so a confirmed transaction also confirms every earlier one
+    for (( i=0; i<${{dust_length}}; i++ ))
+    do
+        address_index=${{dust_address_index_array[$i]}}
+        dust_map_index=${{dust_map_index_array[$i]}}
+        if [[ ${{dust_results_array[$address_index]}} == *${{dust_txid_array[$i]}}* ]] && (( dust_map_index > ${{dust_confirmed_array[$address_index]}} )) ; then
+            dust_confirmed_array[$address_index]=$dust_map_index
+        fi
+    done
+    for (( i=0; i<${{dust_length}}; i++ ))
+    do
+        dust_txid=${{dust_txid_array[$i]}}
+        dust_map_index=${{dust_map_index_array[$i]}}
+        address_index=${{dust_address_index_array[$i]}}
+        dust_address=${{dust_address_array[$address_index]}}
+        echo -e "\\033[KStatus $dust_txid = ${{dust_status_array[$i]}}"
+        if [[ ${{dust_status_array[$i]}} == "$ongoing_str" ]] ; then
+            if (( dust_map_index <= ${{dust_confirmed_array[$address_index]}} )) ; then
+                dust_status_array[$i]=$success_str
+                dust_ongoing_count=$(( dust_ongoing_count - 1 ))
+                {success_status_command}
+            elif (( $latest_slot > {ttl} )) ; then
+                dust_status_array[$i]=$ttl_expired_str
+                dust_ongoing_count=$(( dust_ongoing_count - 1 ))
+                dust_expired_count=$(( dust_expired_count + 1 ))
+                {expired_status_command}
+            fi
+        fi
+    done
+    echo -en "\\r\\033[${{dust_length}}A"
+    if (( dust_ongoing_count > 0 )) ; then
+        sleep $poll_interval
+        poll_interval=$(( poll_interval * 2 > 20 ? 20 : poll_interval * 2 ))
+    fi
+done
+for (( i=0; i<${{dust_length}}; i++ ))
+do
+    echo -e "\\033[KStatus ${{dust_txid_array[$i]}} = ${{dust_status_array[$i]}}"
+done
+if (( dust_expired_count > 0 )) ; then
+    exit 1
+fi
+echo "Dust Transactions Submission Done"
+"""
+
 DUST_SUBMIT_FUNCTION_CALL = (
     "dust_submit_function {signed_file_name} {target_address} {txid_variable_name} "
     "{map_index} {straight_to_poll}"
@@ -151,8 +237,11 @@ if [[ $prep_submit_result ]] ; then
     utxo_results=$({utxo_query_command})
     echo -en "Status ${prep_txid_variable} = $ongoing_str"
     prep_status=$ongoing_str
+    poll_interval=2
     until [[ $utxo_results == *${prep_txid_variable}* ]] || [[ $prep_status != "$ongoing_str" ]]
     do
+        sleep $poll_interval
+        poll_interval=$(( poll_interval * 2 > 20 ? 20 : poll_interval * 2 ))
         utxo_results=$({utxo_query_command})
         latest_slot=$(get_latest_slot_no)
         if (( $latest_slot > {ttl} )) ; then
@@ -197,27 +286,43 @@ do
     group_txid_array+=($({transaction_txid_query}))
 done
 
-while [[ " ${{utxo_status_array[*]}} " =~ " $ongoing_str " ]]
+ongoing_count=${{array_length}}
+poll_interval=2
+while (( ongoing_count > 0 ))
 do
     latest_slot=$(get_latest_slot_no)
+    # Query all the ongoing group inputs at once
+    tx_in_flags=""
+    for (( i=0; i<${{array_length}}; i++ ))
+    do
+        if [[ ${{utxo_status_array[$i]}} == "$ongoing_str" ]] ; then
+            tx_in_flags+=" --tx-in ${prep_txid_variable}#${{group_index_array[$i]}}"
+        fi
+    done
+    group_utxo_results=$({utxo_query_command})
     for (( i=0; i<${{array_length}}; i++ ))
     do
         group_txid=${{group_txid_array[$i]}}
         group_index=${{group_index_array[$i]}}
         echo -e "\\033[KStatus $group_txid = ${{utxo_status_array[$i]}}"
         if [[ ${{utxo_status_array[$i]}} == "$ongoing_str" ]] ; then
-            group_utxo_results=$({utxo_query_command})
-            if [[ $group_utxo_results != *${prep_txid_variable}* ]] ; then
+            group_utxo_pattern="${prep_txid_variable}(#|[[:space:]]+)${{group_index}}([^0-9]|$)"
+            if ! [[ $group_utxo_results =~ $group_utxo_pattern ]] ; then
                 utxo_status_array[$i]=$success_str
+                ongoing_count=$(( ongoing_count - 1 ))
                 {success_status_command}
             elif (( $latest_slot > {ttl} )) ; then
                 utxo_status_array[$i]=$ttl_expired_str
+                ongoing_count=$(( ongoing_count - 1 ))
                 {expired_status_command}
             fi
         fi
     done
     echo -en "\\r\\033[${{array_length}}A"
-    sleep 1
+    if (( ongoing_count > 0 )) ; then
+        sleep $poll_interval
+        poll_interval=$(( poll_interval * 2 > 20 ? 20 : poll_interval * 2 ))
+    fi
 done
 for (( i=0; i<${{array_length}}; i++ ))
 do
@@ -227,6 +332,4 @@ done
 echo "Group Transaction Submission Checking Done"
 """
 
-STAKE_REWARDS_COMMAND = (
-    "{prefix}cardano-cli query stake-address-info --address {address} {network}"
-)
+STAKE_REWARDS_ARGS = ("cardano-cli", "query", "stake-address-info", "--address")
@@ -1,26 +1,32 @@
 import enum
 
 
-class CardanoNetwork(enum.Enum):
+class CardanoNetwork(str, enum.Enum):
     MAINNET = "MAINNET"
     PREPROD = "PREPROD"
     PREVIEW = "PREVIEW"
 
 
-class ScriptMethod(enum.Enum):
+class ScriptMethod(str, enum.Enum):
     METHOD_HOST_CLI = "HOST_CLI"
     METHOD_DOCKER_CLI = "DOCKER_CLI"
     METHOD_PYCARDANO = "PYCARDANO"
 
 
-class ScriptOutputFormats(enum.Enum):
+# Sets for validating arguments without rebuilding a member list on each call
+CARDANO_NETWORKS = frozenset(CardanoNetwork)
+SCRIPT_METHODS = frozenset(ScriptMethod)
+
+
+class ScriptOutputFormats(str, enum.Enum):
     BASH_SCRIPT = "BASH_SCRIPT"
     CONSOLE = "CONSOLE"
     JSON = "JSON"
     TRANSACTION_PLAN = "TRANSACTION_PLAN"
 
 
-class BashColor(enum.Enum):
+class BashColor:
+    # Plain string constants, these are interpolated directly into bash templates
     NO_COLOR = "\\033[0m"
     BOLD_RED = "\\033[1;31m"
     BOLD_GREEN = "\\033[1;32m"
@@ -34,6 +40,16 @@ class TransactionStatus(enum.Enum):
     SUBMISSION_DONE = "SUBMISSION_DONE"
 
 
+# Statuses of transactions that still need to be submitted
+PENDING_TRANSACTION_STATUSES = frozenset(
+    {TransactionStatus.NOT_YET_SUBMITTED, TransactionStatus.TTL_EXPIRED},
+)
+# Statuses of transactions whose submission is not yet done
+UNFINISHED_TRANSACTION_STATUSES = PENDING_TRANSACTION_STATUSES | {
+    TransactionStatus.SUBMISSION_ONGOING,
+}
+
+
 class DustCollectionMethod(enum.Enum):
     COLLECT_TO_SOURCE = "COLLECT_TO_SOURCE"
     COLLECT_PER_ADDRESS = "COLLECT_PER_ADDRESS"
@@ -44,3 +60,16 @@ MAGIC_NUMBER_MAP = {
     "PREPROD": 1,
     "PREVIEW": 2,
 }
+
+# Seconds a cached cardano-cli query result is reused during a script run
+PROTOCOL_PARAMETERS_CACHE_TTL = 300
+LATEST_SLOT_NUMBER_CACHE_TTL = 10
+
+# Maximum number of files copied to the docker container at once
+DOCKER_FILE_COPY_MAX_WORKERS = 8
+
+# Maximum number of transaction sizes measured at once
+TX_SIZE_PROBE_MAX_WORKERS = 8
+
+# Memory backed directory preferred for the temporary files of host runs
+SHARED_MEMORY_DIRECTORY = "/dev/shm"
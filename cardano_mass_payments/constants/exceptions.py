@@ -1,4 +1,6 @@
-import json
+from traceback import format_exception
+
+import orjson
 
 from .common import CardanoNetwork, ScriptMethod
 
@@ -10,27 +12,40 @@ class ScriptError(Exception):
     def __init__(self, message, error=None, traceback=None, additional_context={}):
         self.message = message
         self.error = error
-        self.traceback = traceback
+        # Either a formatted traceback or a sys.exc_info() tuple formatted on access
+        self._traceback = traceback
         self.additional_context = additional_context
 
+    @property
+    def traceback(self):
+        if isinstance(self._traceback, tuple):
+            self._traceback = "".join(format_exception(*self._traceback))
+        return self._traceback
+
+    @traceback.setter
+    def traceback(self, traceback):
+        self._traceback = traceback
+
     def __str__(self):
-        error_str = f"Error {self.code}: {self.message}\n"
+        error_str_parts = [f"Error {self.code}: {self.message}\n"]
         if self.error:
-            error_str += f" Error: {self.error}"
+            error_str_parts.append(f" Error: {self.error}")
         if self.traceback:
-            error_str += f" Traceback: {self.traceback}"
+            error_str_parts.append(f" Traceback: {self.traceback}")
         if self.additional_context:
-            error_str += f" Context: {self.additional_context}"
-        return error_str
+            error_str_parts.append(f" Context: {self.additional_context}")
+        return "".join(error_str_parts)
 
     def json_str(self):
-        return json.dumps(
+        # Context values orjson can't serialize (e.g. types) are written as strings
+        return orjson.dumps(
             {
                 "code": self.code,
                 "message": self.message,
                 "context": self.additional_context,
             },
-        )
+            default=str,
+        ).decode()
 
 
 class InsufficientBalance(ScriptError):
@@ -50,7 +65,7 @@ class InsufficientBalance(ScriptError):
 class InvalidMethod(ScriptError):
     code = 400002
     message = "Invalid Method"
-    allowed_methods = [method.value for method in ScriptMethod]
+    allowed_methods = tuple(method.value for method in ScriptMethod)
 
     def __init__(self, method):
         super().__init__(
@@ -64,8 +79,8 @@ class InvalidMethod(ScriptError):
 
 class InvalidNetwork(ScriptError):
     code = 400003
-    message = "Invalid Method"
-    allowed_methods = [network.value for network in CardanoNetwork]
+    message = "Invalid Network"
+    allowed_methods = tuple(network.value for network in CardanoNetwork)
 
     def __init__(self, network):
         super().__init__(
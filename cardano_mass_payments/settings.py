@@ -1,10 +1,45 @@
-from .constants.common import CardanoNetwork, ScriptMethod
+import threading
+import time
+
+from .constants.common import (
+    PROTOCOL_PARAMETERS_CACHE_TTL,
+    CardanoNetwork,
+    ScriptMethod,
+)
 
 
 class MassPaymentsSettings:
     _cardano_node_docker_image_name = "cardano_node_docker_image_name"
     _cardano_testnet_magic = "1097911063"
     _cardano_minimum_amount = 1000000
+    # Command results reused during a script run, None when not caching
+    _query_results = None
+    _query_locks = None
+
+    def __init__(self):
+        # Prefixes and flags are precomputed since they are formatted into every command
+        self._update_command_prefixes()
+        self._update_testnet_flag()
+        self._query_locks_guard = threading.Lock()
+
+    def _update_command_prefixes(self):
+        docker_prefix = f"docker exec {self._cardano_node_docker_image_name} "
+        self._command_prefixes = {
+            (ScriptMethod.METHOD_HOST_CLI, False): "",
+            (ScriptMethod.METHOD_HOST_CLI, True): "",
+            (ScriptMethod.METHOD_DOCKER_CLI, False): docker_prefix,
+            (ScriptMethod.METHOD_DOCKER_CLI, True): docker_prefix,
+            (ScriptMethod.METHOD_PYCARDANO, False): "",
+            (ScriptMethod.METHOD_PYCARDANO, True): docker_prefix,
+        }
+        # Same prefixes as argument lists, for commands run without a shell
+        self._command_prefix_args = {
+            key: tuple(prefix.split()) for key, prefix in self._command_prefixes.items()
+        }
+
+    def _update_testnet_flag(self):
+        self._testnet_flag = f"--testnet-magic {self._cardano_testnet_magic}"
+        self._testnet_flag_args = ("--testnet-magic", self._cardano_testnet_magic)
 
     @property
     def cardano_node_docker_image_name(self):
@@ -17,30 +52,85 @@ class MassPaymentsSettings:
     @cardano_testnet_magic.setter
     def cardano_testnet_magic(self, magic_number):
         self._cardano_testnet_magic = str(magic_number)
+        self._update_testnet_flag()
 
     @cardano_node_docker_image_name.setter
     def cardano_node_docker_image_name(self, image_name):
         self._cardano_node_docker_image_name = str(image_name)
+        self._update_command_prefixes()
 
     @property
     def cardano_minimum_amount(self):
         return self._cardano_minimum_amount
 
     def command_prefix(self, method, use_docker_cli=False):
-        if method == ScriptMethod.METHOD_HOST_CLI:
-            return ""
-        elif method == ScriptMethod.METHOD_DOCKER_CLI:
-            return f"docker exec {self._cardano_node_docker_image_name} "
-        elif method == ScriptMethod.METHOD_PYCARDANO:
-            return (
-                ""
-                if not use_docker_cli
-                else f"docker exec {self._cardano_node_docker_image_name} "
-            )
+        return self._command_prefixes.get((method, bool(use_docker_cli)))
+
+    def command_prefix_args(self, method, use_docker_cli=False):
+        return self._command_prefix_args.get((method, bool(use_docker_cli)))
 
     def network_flag(self, network):
+        return "--mainnet" if network == CardanoNetwork.MAINNET else self._testnet_flag
+
+    def network_flag_args(self, network):
         return (
-            "--mainnet"
+            ("--mainnet",)
             if network == CardanoNetwork.MAINNET
-            else f"--testnet-magic {self._cardano_testnet_magic}"
+            else self._testnet_flag_args
+        )
+
+    def enable_query_cache(self):
+        """
+        Starts reusing the cardano-cli query results until reset_query_cache is called
+        """
+        # One lock per key, so concurrent callers wait for a single run of the command
+        self._query_locks = {}
+        self._query_results = {}
+
+    def reset_query_cache(self):
+        """
+        Drops the cached cardano-cli query results and stops caching new ones
+        """
+        self._query_results = None
+        self._query_locks = None
+
+    def cached_query(self, key, runner, ttl=None):
+        """
+        Get the result of a command, running it only once per script run
+        :param key: Hashable key identifying the command and its arguments
+        :param runner: Function that runs the command and returns its result
+        :param ttl: Seconds the result stays valid, None if it is valid for the whole run
+        :return: Result of the command
+        """
+        query_results = self._query_results
+        query_locks = self._query_locks
+        if query_results is None or query_locks is None:
+            return runner()
+
+        with self._query_locks_guard:
+            key_lock = query_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            cached_result = query_results.get(key)
+            if cached_result is None or (
+                ttl is not None and time.monotonic() - cached_result[0] > ttl
+            ):
+                cached_result = (time.monotonic(), runner())
+                query_results[key] = cached_result
+
+        return cached_result[1]
+
+    def protocol_params_file(self, method, network, runner):
+        """
+        Get the protocol parameters file, querying it again only once it is older than
+        PROTOCOL_PARAMETERS_CACHE_TTL during a script run
+        :param method: Method that will be used for connecting to cardano
+        :param network: Network where the protocol parameters are fetched
+        :param runner: Function that queries the protocol parameters file and returns its filename
+        :return: Filename of the protocol file
+        """
+        return self.cached_query(
+            ("protocol_params_file", method, network),
+            runner,
+            ttl=PROTOCOL_PARAMETERS_CACHE_TTL,
         )
@@ -1,10 +1,12 @@
-import json
+import itertools
 import os
 import subprocess
+import sys
 import tempfile
-import traceback
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 from pycardano import Address
 from pycardano import Network as PycardanoNetwork
 from pycardano import (
@@ -14,6 +16,7 @@ from pycardano import (
     TransactionBuilder,
     TransactionInput,
     TransactionOutput,
+    TransactionWitnessSet,
     UTxO,
     VerificationKeyWitness,
 )
@@ -26,19 +29,27 @@ from ..classes import InputUTXO
 from ..constants.commands import (
     CHECK_TEMP_DIRECTORY,
     CREATE_FILE_COPY_TO_DOCKER,
-    DELETE_FILE,
-    QUERY_PROTOCOL_PARAMETERS,
-    QUERY_PROTOCOL_PARAMETERS_WITH_FILE,
-    QUERY_TIP,
-    QUERY_WALLET_UTXO,
-    READ_FILE,
-    STAKE_REWARDS_COMMAND,
+    DELETE_FILE_ARGS,
+    QUERY_PROTOCOL_PARAMETERS_ARGS,
+    QUERY_TIP_ARGS,
+    QUERY_WALLET_UTXO_ARGS,
+    READ_FILE_ARGS,
+    STAKE_REWARDS_ARGS,
     TRANSACTION_BUILD,
-    TRANSACTION_FEE,
-    TRANSACTION_SIGN,
-    TRANSACTION_TXID,
+    TRANSACTION_FEE_ARGS,
+    TRANSACTION_SIGN_ARGS,
+    TRANSACTION_TXID_ARGS,
+)
+from ..constants.common import (
+    CARDANO_NETWORKS,
+    DOCKER_FILE_COPY_MAX_WORKERS,
+    LATEST_SLOT_NUMBER_CACHE_TTL,
+    PROTOCOL_PARAMETERS_CACHE_TTL,
+    SHARED_MEMORY_DIRECTORY,
+    CardanoNetwork,
+    ScriptMethod,
+    ScriptOutputFormats,
 )
-from ..constants.common import CardanoNetwork, ScriptMethod
 from ..constants.exceptions import (
     EmptyList,
     InvalidFileError,
@@ -47,7 +58,32 @@ from ..constants.exceptions import (
     InvalidType,
     ScriptError,
 )
-from .common import get_script_settings, print_to_console, subprocess_popen
+from .common import (
+    get_script_settings,
+    print_to_console,
+    script_error_guard,
+    subprocess_popen,
+)
+
+# Transaction files are named with a random id drawn once per process and a counter
+_TX_FILENAME_PREFIX = uuid.uuid4().hex
+_tx_filename_counter = itertools.count()
+
+# Input used when only the number of inputs is known
+_PLACEHOLDER_TX_HASH = "0" * 64
+_PLACEHOLDER_TX_IN_FLAG = f"--tx-in {_PLACEHOLDER_TX_HASH}#1 "
+
+
+def get_command_prefix_args(method):
+    """
+    Get the command prefix arguments of a method, pycardano runs use the prefix of
+    their context
+    :param method: Method that will be used for running the command
+    :return: Tuple of command prefix arguments
+    """
+    if method == ScriptMethod.METHOD_PYCARDANO:
+        return CACHE_VALUES.pycardano_context.command_prefix_args
+    return get_script_settings().command_prefix_args(method)
 
 
 def check_and_create_temp_directory(method=ScriptMethod.METHOD_DOCKER_CLI):
@@ -58,27 +94,40 @@ def check_and_create_temp_directory(method=ScriptMethod.METHOD_DOCKER_CLI):
     """
     temp_directory = ""
     masspayments_settings = get_script_settings()
-    pycardano_context = CACHE_VALUES.get("pycardano_context")
+    pycardano_context = CACHE_VALUES.pycardano_context
     if method == ScriptMethod.METHOD_DOCKER_CLI or (
         method == ScriptMethod.METHOD_PYCARDANO and pycardano_context.use_docker_cli
     ):
         prefix = masspayments_settings.command_prefix(ScriptMethod.METHOD_DOCKER_CLI)
-        check_temp_command = CHECK_TEMP_DIRECTORY.format(prefix=prefix)
-        _, check_temp_error = subprocess_popen(
-            check_temp_command,
-            stderr=subprocess.PIPE,
-            shell=True,
-        ).communicate()  # && can only work on shell=True
 
-        if check_temp_error:
-            raise ScriptError(
-                message="Unexpected Error During Getting Temp Directory.",
-                error=check_temp_error,
-            )
+        def check_temp_directory():
+            check_temp_command = CHECK_TEMP_DIRECTORY.format(prefix=prefix)
+            _, check_temp_error = subprocess_popen(
+                check_temp_command,
+                stderr=subprocess.PIPE,
+                shell=True,
+            ).communicate()  # && can only work on shell=True
+
+            if check_temp_error:
+                raise ScriptError(
+                    message="Unexpected Error During Getting Temp Directory.",
+                    error=check_temp_error,
+                )
+
+            return "/tmp-files/"
 
-        temp_directory = "/tmp-files/"
+        # The directory only has to be checked once per run, not for every file
+        temp_directory = masspayments_settings.cached_query(
+            ("temp_directory", prefix),
+            check_temp_directory,
+        )
     elif method in [ScriptMethod.METHOD_HOST_CLI, ScriptMethod.METHOD_PYCARDANO]:
-        temp_directory = tempfile.gettempdir()
+        # Draft, raw and signed tx files only live for a moment, keep them off disk
+        temp_directory = (
+            SHARED_MEMORY_DIRECTORY
+            if os.access(SHARED_MEMORY_DIRECTORY, os.W_OK)
+            else tempfile.gettempdir()
+        )
 
     if temp_directory != "":
         return os.path.join(temp_directory, "")
@@ -95,8 +144,10 @@ def create_file_copy_in_docker_container(source_filename):
     """
     masspayments_settings = get_script_settings()
     source_dir_and_filename = os.path.split(source_filename)
+    # Named per copy, so concurrent signings never remove each other's key copy
     temp_copy_filename = (
         f"{check_and_create_temp_directory(ScriptMethod.METHOD_DOCKER_CLI)}"
+        f"{_TX_FILENAME_PREFIX}_{next(_tx_filename_counter)}_"
         f"{source_dir_and_filename[1]}"
     )
     copy_command = CREATE_FILE_COPY_TO_DOCKER.format(
@@ -124,24 +175,23 @@ def read_file(filename, method=ScriptMethod.METHOD_DOCKER_CLI):
     Reads a file
     :param filename: File to be read
     :param method: method that will be used for reading the file
-    :return: File contents
+    :return: File contents in bytes
     """
     masspayments_settings = get_script_settings()
     if method in [ScriptMethod.METHOD_DOCKER_CLI, ScriptMethod.METHOD_PYCARDANO]:
-        pycardano_context = CACHE_VALUES.get("pycardano_context")
-        prefix = masspayments_settings.command_prefix(
+        pycardano_context = CACHE_VALUES.pycardano_context
+        prefix_args = masspayments_settings.command_prefix_args(
             method,
-            pycardano_context.command_prefix if pycardano_context else False,
+            pycardano_context.use_docker_cli if pycardano_context else False,
         )
-        file_command = READ_FILE.format(prefix=prefix, filename=filename)
-        file_content = subprocess_popen(
-            file_command.split(),
+        file_content, _ = subprocess_popen(
+            [*prefix_args, *READ_FILE_ARGS, filename],
             stdout=subprocess.PIPE,
-        ).stdout.read()
+        ).communicate()
 
-        return file_content.decode("utf-8")
+        return file_content
     elif method == ScriptMethod.METHOD_HOST_CLI:
-        with open(filename, "r") as file:
+        with open(filename, "rb") as file:
             file_content = file.read()
         return file_content
 
@@ -173,8 +223,8 @@ def get_protocol_parameters(
         )
 
     if method in [ScriptMethod.METHOD_DOCKER_CLI, ScriptMethod.METHOD_HOST_CLI]:
-        prefix = masspayments_settings.command_prefix(method)
-        network_flag = masspayments_settings.network_flag(network)
+        prefix_args = masspayments_settings.command_prefix_args(method)
+        network_args = masspayments_settings.network_flag_args(network)
         protocol_filename = (
             "mainnet-protocol.json"
             if network == CardanoNetwork.MAINNET
@@ -182,42 +232,58 @@ def get_protocol_parameters(
         )
 
         if return_file:
-            protocol_command = QUERY_PROTOCOL_PARAMETERS_WITH_FILE.format(
-                prefix=prefix,
-                network=network_flag,
-                protocol_filename=protocol_filename,
-            )
-            _, protocol_error = subprocess_popen(
-                protocol_command.split(),
-                stderr=subprocess.PIPE,
-            ).communicate()
 
-            if protocol_error:
-                raise ScriptError(
-                    message="Unexpected Error Protocol Fetch.",
-                    error=protocol_error,
-                )
+            def query_protocol_file():
+                _, protocol_error = subprocess_popen(
+                    [
+                        *prefix_args,
+                        *QUERY_PROTOCOL_PARAMETERS_ARGS,
+                        *network_args,
+                        "--out-file",
+                        protocol_filename,
+                    ],
+                    stderr=subprocess.PIPE,
+                ).communicate()
+
+                if protocol_error:
+                    raise ScriptError(
+                        message="Unexpected Error Protocol Fetch.",
+                        error=protocol_error,
+                    )
 
-            return protocol_filename
+                return protocol_filename
+
+            # The file only changes at epoch boundaries, so it is reused for a while
+            return masspayments_settings.protocol_params_file(
+                method,
+                network,
+                query_protocol_file,
+            )
         else:
-            protocol_command = QUERY_PROTOCOL_PARAMETERS.format(
-                prefix=prefix,
-                network=network_flag,
+
+            def query_protocol_details():
+                protocol_results, _ = subprocess_popen(
+                    [*prefix_args, *QUERY_PROTOCOL_PARAMETERS_ARGS, *network_args],
+                    stdout=subprocess.PIPE,
+                ).communicate()
+                protocol_details = orjson.loads(protocol_results)
+
+                return {
+                    "max_tx_size": protocol_details.get("maxTxSize", 0),
+                    "min_fee_per_transaction": protocol_details.get("txFeeFixed", 0),
+                    "fee_per_byte": protocol_details.get("txFeePerByte", 0),
+                }
+
+            # Copied so callers can't change the cached details
+            return dict(
+                masspayments_settings.cached_query(
+                    ("protocol_parameters", method, network),
+                    query_protocol_details,
+                    ttl=PROTOCOL_PARAMETERS_CACHE_TTL,
+                ),
             )
-            protocol_results = subprocess_popen(
-                protocol_command.split(),
-                stdout=subprocess.PIPE,
-            ).stdout.read()
-            protocol_results_str = protocol_results.decode("utf-8")
-            protocol_details = json.loads(protocol_results_str)
-
-            return {
-                "max_tx_size": protocol_details.get("maxTxSize", 0),
-                "min_fee_per_transaction": protocol_details.get("txFeeFixed", 0),
-                "fee_per_byte": protocol_details.get("txFeePerByte", 0),
-            }
     elif method == ScriptMethod.METHOD_PYCARDANO:
-        pycardano_context = CACHE_VALUES.get("pycardano_context")
+        pycardano_context = CACHE_VALUES.pycardano_context
         protocol_details = pycardano_context.protocol_param
         return {
             "max_tx_size": protocol_details.max_tx_size,
@@ -248,23 +314,33 @@ def get_latest_slot_number(
         ScriptMethod.METHOD_DOCKER_CLI,
         ScriptMethod.METHOD_HOST_CLI,
     ]:
-        prefix = masspayments_settings.command_prefix(method)
-        network_flag = masspayments_settings.network_flag(network)
+        prefix_args = masspayments_settings.command_prefix_args(method)
+        network_args = masspayments_settings.network_flag_args(network)
 
-        tip_query_command = QUERY_TIP.format(prefix=prefix, network=network_flag)
-        tip_query_results = subprocess_popen(
-            tip_query_command.split(),
-            stdout=subprocess.PIPE,
-        ).stdout.read()
-        tip_query_results_str = tip_query_results.decode("utf-8")
-        tip_query_details = json.loads(tip_query_results_str)
+        def query_latest_slot_number():
+            tip_query_results, _ = subprocess_popen(
+                [*prefix_args, *QUERY_TIP_ARGS, *network_args],
+                stdout=subprocess.PIPE,
+            ).communicate()
+            tip_query_details = orjson.loads(tip_query_results)
+
+            return tip_query_details.get("slot")
 
-        return tip_query_details.get("slot")
     elif method == ScriptMethod.METHOD_PYCARDANO:
-        pycardano_context = CACHE_VALUES.get("pycardano_context")
-        return pycardano_context.last_block_slot
 
-    raise InvalidMethod(method=method)
+        def query_latest_slot_number():
+            pycardano_context = CACHE_VALUES.pycardano_context
+            return pycardano_context.last_block_slot
+
+    else:
+        raise InvalidMethod(method=method)
+
+    # The tip moves every few seconds, so it is only reused for a short while
+    return masspayments_settings.cached_query(
+        ("latest_slot_number", method, network),
+        query_latest_slot_number,
+        ttl=LATEST_SLOT_NUMBER_CACHE_TTL,
+    )
 
 
 def create_transaction_command(
@@ -297,13 +373,12 @@ def create_transaction_command(
     # Transaction Input Details
     tx_in_details = ""
     if isinstance(input_arg, int):
-        tx_in_details += (
-            "--tx-in 0000000000000000000000000000000000000000000000000000000000000000#1 "
-            * input_arg
-        )
+        tx_in_details = _PLACEHOLDER_TX_IN_FLAG * input_arg
     elif isinstance(input_arg, list):
-        for utxo_detail in input_arg:
-            tx_in_details += f"--tx-in {utxo_detail.tx_hash}#{utxo_detail.tx_index} "
+        tx_in_details = "".join(
+            f"--tx-in {utxo_detail.tx_hash}#{utxo_detail.tx_index} "
+            for utxo_detail in input_arg
+        )
     else:
         raise ScriptError(
             message="Invalid input argument type.",
@@ -350,15 +425,18 @@ def create_transaction_command(
     # Transaction Output Details
     tx_out_details = ""
     if isinstance(output_arg, int):
-        source_address = CACHE_VALUES.get("source_address", "")
+        source_address = CACHE_VALUES.source_address or ""
         tx_out_details += f"--tx-out {source_address}+0 " * output_arg
+    elif isinstance(output_arg, list) and is_draft:
+        # Draft transactions only need the output count, so amounts are zeroed
+        tx_out_details = "".join(
+            f"--tx-out {utxo_detail.address}+0 " for utxo_detail in output_arg
+        )
     elif isinstance(output_arg, list):
-        for utxo_detail in output_arg:
-            utxo_address = utxo_detail.address
-            utxo_amount = 0
-            if not is_draft:
-                utxo_amount = utxo_detail.amount
-            tx_out_details += f"--tx-out {utxo_address}+{utxo_amount} "
+        tx_out_details = "".join(
+            f"--tx-out {utxo_detail.address}+{utxo_detail.amount} "
+            for utxo_detail in output_arg
+        )
     else:
         raise ScriptError(
             message="Invalid output argument type.",
@@ -423,7 +501,10 @@ def create_transaction_file(
     if method in [ScriptMethod.METHOD_DOCKER_CLI, ScriptMethod.METHOD_HOST_CLI]:
         # Create transaction draft
         prefix = masspayments_settings.command_prefix(method)
-        tx_filename = f"{check_and_create_temp_directory(method)}{uuid.uuid4().hex}."
+        tx_filename = (
+            f"{check_and_create_temp_directory(method)}"
+            f"{_TX_FILENAME_PREFIX}_{next(_tx_filename_counter)}."
+        )
         tx_filename += "draft" if is_draft else "raw"
 
         try:
@@ -434,7 +515,7 @@ def create_transaction_file(
                 prefix=prefix,
                 fee=fee,
                 ttl=ttl,
-                metadata_filename=CACHE_VALUES.get("metadata_file"),
+                metadata_filename=CACHE_VALUES.metadata_file,
                 is_draft=is_draft,
                 reward_details=reward_details,
             )
@@ -444,7 +525,7 @@ def create_transaction_file(
             raise ScriptError(
                 message="Unexpected Error During TX File Creation.",
                 error=e,
-                traceback=traceback.format_exc(),
+                traceback=sys.exc_info(),
             )  # Error during Build TX Command Creation
 
         _, process_error = subprocess_popen(
@@ -461,26 +542,23 @@ def create_transaction_file(
         return tx_filename
     elif method == ScriptMethod.METHOD_PYCARDANO:
         # Get pycardano context object
-        pycardano_context = CACHE_VALUES.get("pycardano_context")
+        pycardano_context = CACHE_VALUES.pycardano_context
         tx_builder = TransactionBuilder(pycardano_context)
 
-        source_address = CACHE_VALUES.get("source_address", "")
+        source_address = CACHE_VALUES.source_address or ""
 
         if isinstance(input_arg, int):
+            # Placeholder inputs are identical, so they share one parsed input/output
+            placeholder_input = TransactionInput.from_primitive(
+                [_PLACEHOLDER_TX_HASH, 1],
+            )
+            # Fake amount just to handle price coverage
+            placeholder_output = TransactionOutput.from_primitive(
+                [source_address, 999999999],
+            )
             for _ in range(input_arg):
                 tx_builder.add_input(
-                    UTxO(
-                        input=TransactionInput.from_primitive(
-                            [
-                                "0000000000000000000000000000000000000000000000000000000000000000",
-                                1,
-                            ],
-                        ),
-                        # Fake amount just to handle price coverage
-                        output=TransactionOutput.from_primitive(
-                            [source_address, 999999999],
-                        ),
-                    ),
+                    UTxO(input=placeholder_input, output=placeholder_output),
                 )
         elif isinstance(input_arg, list):
             for utxo_detail in input_arg:
@@ -496,12 +574,10 @@ def create_transaction_file(
                 )
 
         if isinstance(output_arg, int):
+            source_address_obj = Address.from_primitive(source_address)
             for _ in range(output_arg):
                 tx_builder.add_output(
-                    TransactionOutput(
-                        address=Address.from_primitive(source_address),
-                        amount=0,
-                    ),
+                    TransactionOutput(address=source_address_obj, amount=0),
                 )
         elif isinstance(output_arg, list):
             for payment_detail in output_arg:
@@ -512,17 +588,27 @@ def create_transaction_file(
                     ),
                 )
 
-        if CACHE_VALUES.get("metadata_file"):
-            with open(CACHE_VALUES.get("metadata_file"), "r") as file:
-                metadata_content = file.read()
-                metadata_details = json.loads(metadata_content)
+        metadata_file = CACHE_VALUES.metadata_file
+        if metadata_file:
+
+            def parse_metadata_file():
+                with open(metadata_file, "rb") as file:
+                    metadata_details = orjson.loads(file.read())
                 # For PyCardano Metadata, Keys should be of integer type
                 tx_auxiliary_data = {}
                 for key in metadata_details:
                     tx_auxiliary_data[int(key)] = metadata_details[key]
-                tx_builder.auxiliary_data = AuxiliaryData(
-                    data=AlonzoMetadata(metadata=tx_auxiliary_data),
-                )
+                return AuxiliaryData(data=AlonzoMetadata(metadata=tx_auxiliary_data))
+
+            # Parsed once per run, unless the file changes in the meantime
+            tx_builder.auxiliary_data = masspayments_settings.cached_query(
+                (
+                    "metadata_auxiliary_data",
+                    metadata_file,
+                    os.stat(metadata_file).st_mtime_ns,
+                ),
+                parse_metadata_file,
+            )
 
         if fee:
             tx_builder.fee = fee
@@ -561,27 +647,23 @@ def delete_temp_file(filename, method=ScriptMethod.METHOD_DOCKER_CLI):
     """
     Deletes the transaction draft file
 
-    :param filename: Transaction Draft Filename
+    :param filename: Transaction Draft Filename or List of Filenames deleted in one command
     :param method: Method that will be used for deleting transaction draft
     :return: True if Delete File succeeds
     """
-    masspayments_settings = get_script_settings()
     if method in [
         ScriptMethod.METHOD_DOCKER_CLI,
         ScriptMethod.METHOD_HOST_CLI,
         ScriptMethod.METHOD_PYCARDANO,
     ]:
-        prefix = masspayments_settings.command_prefix(method)
-        if method == ScriptMethod.METHOD_PYCARDANO:
-            if isinstance(filename, dict):
-                # This is a transaction object
-                return True
-            pycardano_context = CACHE_VALUES.get("pycardano_context")
-            prefix = pycardano_context.command_prefix
-        delete_command = DELETE_FILE.format(prefix=prefix, filename=filename)
+        if method == ScriptMethod.METHOD_PYCARDANO and isinstance(filename, dict):
+            # This is a transaction object
+            return True
+        prefix_args = get_command_prefix_args(method)
 
+        filenames = filename if isinstance(filename, list) else [filename]
         _, delete_error = subprocess_popen(
-            delete_command.split(),
+            [*prefix_args, *DELETE_FILE_ARGS, *filenames],
             stderr=subprocess.PIPE,
         ).communicate()
 
@@ -616,16 +698,16 @@ def get_tx_size(tx_file, method=ScriptMethod.METHOD_DOCKER_CLI):
         raise InvalidFileError(
             message="Unexpected Error Reading TX File.",
             error=e,
-            traceback=traceback.format_exc(),
+            traceback=sys.exc_info(),
             file=tx_file,
         )  # Error during read transaction draft file
 
     # Convert content to object
-    tx_details = json.loads(tx_content)
+    tx_details = orjson.loads(tx_content)
     tx_raw = tx_details.get("cborHex", "")
-    tx_byte_array = bytearray.fromhex(tx_raw)
 
-    return len(tx_byte_array)
+    # Two hex digits per byte, no need to decode the transaction
+    return len(tx_raw) // 2
 
 
 def sign_tx_file(
@@ -649,46 +731,48 @@ def sign_tx_file(
             type=type(signing_key_files),
             message="Invalid signing key file list argument type.",
         )
-    if network not in [cn for cn in CardanoNetwork]:
+    if network not in CARDANO_NETWORKS:
         raise InvalidNetwork(network=network)
 
     if method in [ScriptMethod.METHOD_DOCKER_CLI, ScriptMethod.METHOD_HOST_CLI]:
-        prefix = masspayments_settings.command_prefix(method)
+        prefix_args = masspayments_settings.command_prefix_args(method)
         tx_filename = f"{tx_file}.signed"
-        network_flag = masspayments_settings.network_flag(network)
+        network_args = masspayments_settings.network_flag_args(network)
 
         signing_file_list = signing_key_files
         if method == ScriptMethod.METHOD_DOCKER_CLI:
-            signing_file_list = []
-            for sign_key_filename in signing_key_files:
+
+            def copy_signing_key_file(sign_key_filename):
                 # Create a temporary signing key file
                 try:
-                    temp_signing_key_filename = create_file_copy_in_docker_container(
-                        sign_key_filename,
-                    )
+                    return create_file_copy_in_docker_container(sign_key_filename)
                 except ScriptError as e:
                     raise e
                 except Exception as e:
                     raise InvalidFileError(
                         message="Unexpected Error Creating a temporary copy in Docker Container.",
                         error=e,
-                        traceback=traceback.format_exc(),
+                        traceback=sys.exc_info(),
                         file=sign_key_filename,
                     )
-                signing_file_list.append(temp_signing_key_filename)
-        signing_file_parameters = [
-            f"--signing-key-file {sk_file}" for sk_file in signing_file_list
-        ]
 
-        sign_command = TRANSACTION_SIGN.format(
-            prefix=prefix,
-            raw_file=tx_file,
-            network=network_flag,
-            signing_key_file_details=" ".join(signing_file_parameters),
-            signed_file=tx_filename,
-        )
+            # Each copy waits on the docker daemon, so the copies are made concurrently
+            with ThreadPoolExecutor(
+                max_workers=max(
+                    1,
+                    min(DOCKER_FILE_COPY_MAX_WORKERS, len(signing_key_files)),
+                ),
+            ) as executor:
+                signing_file_list = list(
+                    executor.map(copy_signing_key_file, signing_key_files),
+                )
+        sign_command = [*prefix_args, *TRANSACTION_SIGN_ARGS, tx_file]
+        for sk_file in signing_file_list:
+            sign_command += ("--signing-key-file", sk_file)
+        sign_command += (*network_args, "--out-file", tx_filename)
+
         _, sign_error = subprocess_popen(
-            sign_command.split(),
+            sign_command,
             stderr=subprocess.PIPE,
         ).communicate()  # && Works in shell = True
         if sign_error:
@@ -699,19 +783,18 @@ def sign_tx_file(
             )
 
         if method == ScriptMethod.METHOD_DOCKER_CLI:
-            # Remove Signing Key Files
-            for sk_file in signing_file_list:
-                try:
-                    delete_temp_file(sk_file, method=method)
-                except ScriptError as e:
-                    raise e
-                except Exception as e:
-                    raise InvalidFileError(
-                        message="Unexpected Error Deleting Signing Key File.",
-                        error=e,
-                        traceback=traceback.format_exc(),
-                        file=sk_file,
-                    )
+            # Remove Signing Key Files, all in a single command
+            try:
+                delete_temp_file(signing_file_list, method=method)
+            except ScriptError as e:
+                raise e
+            except Exception as e:
+                raise InvalidFileError(
+                    message="Unexpected Error Deleting Signing Key File.",
+                    error=e,
+                    traceback=sys.exc_info(),
+                    file=signing_file_list,
+                )
 
         return tx_filename
     elif method == ScriptMethod.METHOD_PYCARDANO:
@@ -724,10 +807,11 @@ def sign_tx_file(
         tx_body = tx_object.transaction_body
 
         # Sign TX
-        witness_set = tx_builder.build_witness_set()
-        witness_set.vkey_witnesses = []
+        # Mass payments don't use scripts, so the witness set only holds key witnesses
+        witness_set = TransactionWitnessSet(vkey_witnesses=[])
+        tx_body_hash = tx_body.hash()
         for signing_key in psk_list:
-            signature = signing_key.sign(tx_body.hash())
+            signature = signing_key.sign(tx_body_hash)
             witness_set.vkey_witnesses.append(
                 VerificationKeyWitness(signing_key.to_verification_key(), signature),
             )
@@ -785,7 +869,7 @@ def get_transaction_byte_size(
         raise EmptyList(field="Input UTxO List")
     if num_output < 1:
         raise EmptyList(field="Output UTxO List")
-    if network not in [cn for cn in CardanoNetwork]:
+    if network not in CARDANO_NETWORKS:
         raise InvalidNetwork(network=network)
     if not isinstance(signing_key_files, list):
         raise InvalidType(
@@ -799,55 +883,39 @@ def get_transaction_byte_size(
         )
 
     if method in [ScriptMethod.METHOD_DOCKER_CLI, ScriptMethod.METHOD_HOST_CLI]:
-        # Create Draft File
-        try:
-            draft_file = create_transaction_file(
-                input_arg=input_arg,
-                output_arg=output_arg,
-                method=method,
-                reward_details=reward_details,
-            )
-        except ScriptError as e:
-            raise e
-        except Exception as e:
-            raise ScriptError(
-                message="Unexpected Error Creating TX Draft File.",
-                error=e,
-                traceback=traceback.format_exc(),
-            )  # Error during create transaction draft file
-
-        # Find Fee
-        try:
-            tx_fee = get_transaction_fee(
-                num_input=num_input,
-                num_output=num_output,
-                draft_file=draft_file,
+        # The slot number does not depend on the draft, so it is queried meanwhile
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            slot_number_future = executor.submit(
+                get_latest_slot_number,
                 network=network,
                 method=method,
             )
-        except ScriptError as e:
-            raise e
-        except Exception as e:
-            raise ScriptError(
-                message="Unexpected Error Getting TX Fee.",
-                error=e,
-                traceback=traceback.format_exc(),
-            )  # Error during Fee Computation
 
-        # Get Latest Slot Number
-        try:
-            slot_number = get_latest_slot_number(network=network, method=method)
-        except ScriptError as e:
-            raise e
-        except Exception as e:
-            raise ScriptError(
-                message="Unexpected Error Getting Latest Slot Number.",
-                error=e,
-                traceback=traceback.format_exc(),
-            )  # Error during Slot Number Fetch
+            # Create Draft File
+            with script_error_guard("Unexpected Error Creating TX Draft File."):
+                draft_file = create_transaction_file(
+                    input_arg=input_arg,
+                    output_arg=output_arg,
+                    method=method,
+                    reward_details=reward_details,
+                )
+
+            # Find Fee
+            with script_error_guard("Unexpected Error Getting TX Fee."):
+                tx_fee = get_transaction_fee(
+                    num_input=num_input,
+                    num_output=num_output,
+                    draft_file=draft_file,
+                    network=network,
+                    method=method,
+                )
+
+            # Get Latest Slot Number
+            with script_error_guard("Unexpected Error Getting Latest Slot Number."):
+                slot_number = slot_number_future.result()
 
         # Create Raw File
-        try:
+        with script_error_guard("Unexpected Error Creating TX Draft File."):
             raw_file = create_transaction_file(
                 input_arg=input_arg,
                 output_arg=output_arg,
@@ -857,79 +925,45 @@ def get_transaction_byte_size(
                 is_draft=False,
                 reward_details=reward_details,
             )
-        except ScriptError as e:
-            raise e
-        except Exception as e:
-            raise ScriptError(
-                message="Unexpected Error Creating TX Draft File.",
-                error=e,
-                traceback=traceback.format_exc(),
-            )  # Error during create transaction draft file
 
         # Create Signed File
-        try:
+        with script_error_guard(
+            "Unexpected Error Signing TX File.",
+            error_class=InvalidFileError,
+            file=raw_file,
+        ):
             if not signing_key_files:
-                signing_key_files = CACHE_VALUES.get("source_signing_key_file")
+                signing_key_files = CACHE_VALUES.source_signing_key_file
             signed_file = sign_tx_file(
                 tx_file=raw_file,
                 network=network,
                 method=method,
                 signing_key_files=signing_key_files,
             )
-        except ScriptError as e:
-            raise e
-        except Exception as e:
-            raise InvalidFileError(
-                message="Unexpected Error Signing TX File.",
-                error=e,
-                traceback=traceback.format_exc(),
-                file=raw_file,
-            )  # Error during transaction signing
 
         # Get Signed File
-        try:
+        with script_error_guard(
+            "Unexpected Error Getting TX File Size.",
+            error_class=InvalidFileError,
+            file=signed_file,
+        ):
             tx_size = get_tx_size(tx_file=signed_file, method=method)
-        except ScriptError as e:
-            raise e
-        except Exception as e:
-            raise InvalidFileError(
-                message="Unexpected Error Getting TX File Size.",
-                error=e,
-                traceback=traceback.format_exc(),
-                file=signed_file,
-            )  # Error during read transaction draft file
 
         # Delete Temporary Files
         files_to_delete_list = [draft_file, raw_file, signed_file]
-        # Delete Draft File
-        for file_to_delete in files_to_delete_list:
-            try:
-                delete_temp_file(file_to_delete, method)
-            except ScriptError as e:
-                raise e
-            except Exception as e:
-                raise InvalidFileError(
-                    message="Unexpected Error Deleting Draft TX Files.",
-                    error=e,
-                    traceback=traceback.format_exc(),
-                    file=file_to_delete,
-                )  # Error during delete transaction draft file
+        # Removed with a single command, saving a docker exec per file
+        with script_error_guard(
+            "Unexpected Error Deleting Draft TX Files.",
+            error_class=InvalidFileError,
+            file=files_to_delete_list,
+        ):
+            delete_temp_file(files_to_delete_list, method)
 
         return tx_size
     elif method in [ScriptMethod.METHOD_PYCARDANO]:
-        pycardano_context = CACHE_VALUES.get("pycardano_context")
-
         # Get Latest Slot Number
-        try:
-            tx_ttl = pycardano_context.last_block_slot
-        except ScriptError as e:
-            raise e
-        except Exception as e:
-            raise ScriptError(
-                message="Unexpected Error Getting Latest Slot Number.",
-                error=e,
-                traceback=traceback.format_exc(),
-            )  # Error during Slot Number Fetch
+        with script_error_guard("Unexpected Error Getting Latest Slot Number."):
+            tx_ttl = get_latest_slot_number(network=network, method=method)
 
         try:
             tx_details = create_transaction_file(
@@ -938,9 +972,9 @@ def get_transaction_byte_size(
                 method=method,
             )
 
-            tx_obj = tx_details.get("transaction_object")
-            tx_builder = tx_details.get("tx_builder")
-            tx_body = tx_obj.transaction_body
+            # The body is updated in place, the draft is not rebuilt since signing
+            # replaces its fake witness set anyway
+            tx_body = tx_details.get("transaction_object").transaction_body
             tx_body.fee = get_transaction_fee(
                 num_input=num_input,
                 num_output=num_output,
@@ -949,11 +983,6 @@ def get_transaction_byte_size(
                 method=method,
             )
             tx_body.ttl = tx_ttl
-            tx_details["transaction_object"] = Transaction(
-                tx_body,
-                tx_builder._build_fake_witness_set(),
-                auxiliary_data=tx_builder.auxiliary_data,
-            )
 
             # Sign TX
             signed_tx_details = sign_tx_file(
@@ -970,7 +999,7 @@ def get_transaction_byte_size(
             raise ScriptError(
                 message="Unexpected Error Building and Signing TX Details via PyCardano.",
                 error=e,
-                traceback=traceback.format_exc(),
+                traceback=sys.exc_info(),
             )  # Error during build and sign transaction via pycardano
 
     raise InvalidMethod(method=method)
@@ -1033,76 +1062,58 @@ def get_transaction_fee(
         # Create Draft File
         if draft_file is None:
             remove_draft_file = True
-            try:
+            with script_error_guard("Unexpected Error Creating TX Draft File."):
                 draft_file = create_transaction_file(
                     input_arg=num_input,
                     output_arg=num_output,
                     method=method,
                 )
-            except ScriptError as e:
-                raise e
-            except Exception as e:
-                raise ScriptError(
-                    message="Unexpected Error Creating TX Draft File.",
-                    error=e,
-                    traceback=traceback.format_exc(),
-                )  # Error during create transaction draft file
 
     if method in [ScriptMethod.METHOD_DOCKER_CLI, ScriptMethod.METHOD_HOST_CLI]:
         # Get Protocol File
-        try:
+        with script_error_guard("Unexpected Error Getting Protocol Parameters."):
             protocol_file = get_protocol_parameters(
                 network=network,
                 method=method,
                 return_file=True,
             )
-        except ScriptError as e:
-            raise e
-        except Exception as e:
-            raise ScriptError(
-                message="Unexpected Error Getting Protocol Parameters.",
-                error=e,
-                traceback=traceback.format_exc(),
-            )  # Error during fetch protocol
-
-        prefix = masspayments_settings.command_prefix(method)
-        network_flag = masspayments_settings.network_flag(network)
-
-        fee_command = TRANSACTION_FEE.format(
-            prefix=prefix,
-            draft_file=draft_file,
-            num_input=num_input,
-            num_output=num_output,
-            network=network_flag,
-            protocol_file=protocol_file,
-            num_witness=num_witness,
-        )
 
-        fee_content = subprocess_popen(
-            fee_command.split(),
+        prefix_args = masspayments_settings.command_prefix_args(method)
+        network_args = masspayments_settings.network_flag_args(network)
+
+        fee_content, _ = subprocess_popen(
+            [
+                *prefix_args,
+                *TRANSACTION_FEE_ARGS,
+                draft_file,
+                "--tx-in-count",
+                str(num_input),
+                "--tx-out-count",
+                str(num_output),
+                *network_args,
+                "--protocol-params-file",
+                protocol_file,
+                "--witness-count",
+                str(num_witness),
+            ],
             stdout=subprocess.PIPE,
-        ).stdout.read()
+        ).communicate()
         # Format is of b'n Lovelace'
         fee_string = fee_content.decode("utf-8")
         fee = int(fee_string.split()[0])
 
         # Delete Draft File
         if remove_draft_file:
-            try:
+            with script_error_guard(
+                "Unexpected Error Deleting Draft TX File.",
+                error_class=InvalidFileError,
+                file=draft_file,
+            ):
                 delete_temp_file(draft_file, method)
-            except ScriptError as e:
-                raise e
-            except Exception as e:
-                raise InvalidFileError(
-                    message="Unexpected Error Deleting Draft TX File.",
-                    error=e,
-                    traceback=traceback.format_exc(),
-                    file=draft_file,
-                )  # Error during delete transaction draft file
 
         return fee
     elif method == ScriptMethod.METHOD_PYCARDANO:
-        pycardano_context = CACHE_VALUES.get("pycardano_context")
+        pycardano_context = CACHE_VALUES.pycardano_context
         tx_builder = draft_file.get("tx_builder")
         draft_tx = draft_file.get("transaction_object")
 
@@ -1163,62 +1174,74 @@ def get_total_amount_plus_fee(
     if network not in [CardanoNetwork.MAINNET, CardanoNetwork.PREPROD, CardanoNetwork.PREVIEW]:
         raise InvalidNetwork(network=network)
 
-    total_amount = 0
-    for utxo_detail in output_list:
-        total_amount += utxo_detail.amount
+    total_amount = sum(utxo_detail.amount for utxo_detail in output_list)
 
     if method in [
         ScriptMethod.METHOD_DOCKER_CLI,
         ScriptMethod.METHOD_HOST_CLI,
         ScriptMethod.METHOD_PYCARDANO,
     ]:
-        # Create Draft File
-        try:
-            draft_file = create_transaction_file(
-                input_arg=input_arg,
-                output_arg=output_list,
-                method=method,
-            )
-        except ScriptError as e:
-            raise e
-        except Exception as e:
-            raise ScriptError(
-                message="Unexpected Error Creating Draft TX File.",
-                error=e,
-                traceback=traceback.format_exc(),
-            )  # Error during create transaction draft file
+        masspayments_settings = get_script_settings()
 
-        # Calculate Fee
-        try:
-            tx_fee = get_transaction_fee(
-                num_input=num_input,
-                num_output=num_output,
-                draft_file=draft_file,
-                num_witness=num_witness,
-                network=network,
-                method=method,
-            )
-        except ScriptError as e:
-            raise e
-        except Exception as e:
-            raise ScriptError(
-                message="Unexpected Error Getting TX Fee.",
-                error=e,
-                traceback=traceback.format_exc(),
-            )  # Error during fee calculation
+        def calculate_fee():
+            # Create Draft File
+            with script_error_guard("Unexpected Error Creating Draft TX File."):
+                draft_file = create_transaction_file(
+                    input_arg=input_arg,
+                    output_arg=output_list,
+                    method=method,
+                )
 
-        # Delete Draft File
-        try:
-            delete_temp_file(filename=draft_file, method=method)
-        except ScriptError as e:
-            raise e
-        except Exception as e:
-            raise InvalidFileError(
-                message="Unexpected Error Deleting UTxO File.",
-                error=e,
-                traceback=traceback.format_exc(),
+            # Calculate Fee
+            with script_error_guard("Unexpected Error Getting TX Fee."):
+                tx_fee = get_transaction_fee(
+                    num_input=num_input,
+                    num_output=num_output,
+                    draft_file=draft_file,
+                    num_witness=num_witness,
+                    network=network,
+                    method=method,
+                )
+
+            # Delete Draft File
+            with script_error_guard(
+                "Unexpected Error Deleting UTxO File.",
+                error_class=InvalidFileError,
                 file=draft_file,
-            )  # Error during delete transaction draft file
+            ):
+                delete_temp_file(filename=draft_file, method=method)
+
+            return tx_fee
+
+        # The fee only depends on the draft, so drafts of the same shape share it
+        if isinstance(input_arg, int):
+            input_key = input_arg
+        else:
+            input_key = tuple(
+                (utxo_detail.address, utxo_detail.tx_hash, utxo_detail.tx_index)
+                for utxo_detail in input_arg
+            )
+        if method == ScriptMethod.METHOD_PYCARDANO:
+            output_key = tuple(
+                (utxo_detail.address, utxo_detail.amount) for utxo_detail in output_list
+            )
+        else:
+            # CLI drafts zero the output amounts
+            output_key = tuple(utxo_detail.address for utxo_detail in output_list)
+        tx_fee = masspayments_settings.cached_query(
+            (
+                "draft_transaction_fee",
+                method,
+                network,
+                input_key,
+                output_key,
+                num_witness,
+                CACHE_VALUES.source_address,
+                CACHE_VALUES.metadata_file,
+            ),
+            calculate_fee,
+            ttl=PROTOCOL_PARAMETERS_CACHE_TTL,
+        )
 
         return total_amount, tx_fee
 
@@ -1232,12 +1255,10 @@ def get_utxo_extra_details(utxo_extras_map):
     :return: a formatted list containing the token and their amount
     """
     extras_list = []
-    for token in utxo_extras_map.keys():
-        # Convert token to ascii
-        token_bytes = bytearray.fromhex(token)
-        extras_list.append(
-            f"- {utxo_extras_map.get(token)} {token_bytes.decode(encoding='utf-8')}",
-        )
+    for token, token_amount in utxo_extras_map.items():
+        # Convert token to ascii, asset names are not required to be valid text
+        token_name = bytes.fromhex(token).decode(encoding="utf-8", errors="replace")
+        extras_list.append(f"- {token_amount} {token_name}")
     return extras_list
 
 
@@ -1267,22 +1288,20 @@ def get_wallet_utxo(
         ScriptMethod.METHOD_HOST_CLI,
         ScriptMethod.METHOD_PYCARDANO,
     ]:
-        prefix = masspayments_settings.command_prefix(method)
-        if method == ScriptMethod.METHOD_PYCARDANO:
-            pycardano_context = CACHE_VALUES.get("pycardano_context")
-            prefix = pycardano_context.command_prefix
+        prefix_args = get_command_prefix_args(method)
 
-        network_flag = masspayments_settings.network_flag(network)
+        network_args = masspayments_settings.network_flag_args(network)
         utxo_filename = f"{check_and_create_temp_directory(method)}utxo-{address}.json"
-        utxo_command = QUERY_WALLET_UTXO.format(
-            prefix=prefix,
-            address=address,
-            network=network_flag,
-            utxo_filename=utxo_filename,
-        )
 
         _, utxo_error = subprocess_popen(
-            utxo_command.split(),
+            [
+                *prefix_args,
+                *QUERY_WALLET_UTXO_ARGS,
+                address,
+                *network_args,
+                "--out-file",
+                utxo_filename,
+            ],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
         ).communicate()
@@ -1302,7 +1321,7 @@ def get_wallet_utxo(
             raise ScriptError(
                 message="Unexpected Error While Getting UTxO File Details.",
                 error=e,
-                traceback=traceback.format_exc(),
+                traceback=sys.exc_info(),
             )  # Error during read utxo file
 
         # Delete UTxO File
@@ -1314,36 +1333,37 @@ def get_wallet_utxo(
             raise ScriptError(
                 message="Unexpected Error While Getting UTxO File Details.",
                 error=e,
-                traceback=traceback.format_exc(),
+                traceback=sys.exc_info(),
             )  # Error during delete transaction draft file
 
-        utxo_content = json.loads(utxo_content)
+        utxo_content = orjson.loads(utxo_content)
         utxo_details = []
+        output_format = CACHE_VALUES.output_format
 
         # Get UTxO details
-        for utxo_key in utxo_content:
-            utxo_hash_index = utxo_key.split("#")
-            utxo_detail = utxo_content.get(utxo_key)
+        for utxo_key, utxo_detail in utxo_content.items():
             value_details = utxo_detail.get("value", {})
-            value_keys = set(value_details.keys())
-            extra_values_list = []
-            if value_keys != {"lovelace"}:
-                value_keys.remove("lovelace")
-                for policy_id in value_keys:
-                    extra_values_list += get_utxo_extra_details(
-                        value_details.get(policy_id, {}),
-                    )
+            if len(value_details) != 1 or "lovelace" not in value_details:
+                if output_format == ScriptOutputFormats.JSON:
+                    # The ignored UTxO message is not printed in JSON output
+                    continue
+                extra_values_list = []
+                for policy_id, policy_details in value_details.items():
+                    if policy_id == "lovelace":
+                        continue
+                    extra_values_list += get_utxo_extra_details(policy_details)
                 extra_values_str = "\n".join(extra_values_list)
                 print_to_console(
                     f"Ignoring UTxO {utxo_key} for having these extra values:\n{extra_values_str}",
-                    output_format=CACHE_VALUES.get("output_format"),
+                    output_format=output_format,
                 )
                 continue
+            tx_hash, _, tx_index = utxo_key.partition("#")
             utxo_details.append(
                 InputUTXO(
                     address=address,
-                    tx_hash=utxo_hash_index[0],
-                    tx_index=int(utxo_hash_index[1]),
+                    tx_hash=tx_hash,
+                    tx_index=int(tx_index),
                     amount=value_details.get("lovelace", 0),
                 ),
             )
@@ -1366,8 +1386,6 @@ def get_utxo_hash(
     :return: UTxO hash
     """
 
-    masspayments_settings = get_script_settings()
-
     if network not in [CardanoNetwork.MAINNET, CardanoNetwork.PREPROD, CardanoNetwork.PREVIEW]:
         raise InvalidNetwork(network=network)
 
@@ -1382,19 +1400,12 @@ def get_utxo_hash(
         ScriptMethod.METHOD_HOST_CLI,
         ScriptMethod.METHOD_PYCARDANO,
     ]:
-        prefix = masspayments_settings.command_prefix(method)
-        if method == ScriptMethod.METHOD_PYCARDANO:
-            pycardano_context = CACHE_VALUES.get("pycardano_context")
-            prefix = pycardano_context.command_prefix
+        prefix_args = get_command_prefix_args(method)
 
-        utxo_command = TRANSACTION_TXID.format(
-            prefix=prefix,
-            transaction_file=transaction_file,
-        )
-        utxo_hash_results = subprocess_popen(
-            utxo_command.split(),
+        utxo_hash_results, _ = subprocess_popen(
+            [*prefix_args, *TRANSACTION_TXID_ARGS, transaction_file],
             stdout=subprocess.PIPE,
-        ).stdout.read()
+        ).communicate()
         utxo_hash = utxo_hash_results.decode("utf-8").strip()
 
         return utxo_hash
@@ -1465,34 +1476,22 @@ def get_stake_address_balance(
         ScriptMethod.METHOD_HOST_CLI,
         ScriptMethod.METHOD_PYCARDANO,
     ]:
-        prefix = masspayments_settings.command_prefix(method)
-        if method == ScriptMethod.METHOD_PYCARDANO:
-            pycardano_context = CACHE_VALUES.get("pycardano_context")
-            prefix = pycardano_context.command_prefix
-        network_flag = masspayments_settings.network_flag(network)
-
-        rewards_command = STAKE_REWARDS_COMMAND.format(
-            prefix=prefix,
-            address=stake_address,
-            network=network_flag,
-        )
+        prefix_args = get_command_prefix_args(method)
+        network_args = masspayments_settings.network_flag_args(network)
+
         try:
-            rewards_results = (
-                subprocess_popen(
-                    rewards_command.split(),
-                    stdout=subprocess.PIPE,
-                )
-                .stdout.read()
-                .decode("utf-8")
-            )
-            rewards_details = json.loads(rewards_results)
+            rewards_results, _ = subprocess_popen(
+                [*prefix_args, *STAKE_REWARDS_ARGS, stake_address, *network_args],
+                stdout=subprocess.PIPE,
+            ).communicate()
+            rewards_details = orjson.loads(rewards_results)
 
             return rewards_details[0].get("rewardAccountBalance")
         except Exception as e:
             raise ScriptError(
                 message="Error during Stake Address Balance Fetch.",
                 error=e,
-                traceback=traceback.format_exc(),
+                traceback=sys.exc_info(),
                 additional_context={"stake_address": stake_address},
             )
 
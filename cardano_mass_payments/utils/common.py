@@ -1,5 +1,8 @@
 import json
+import os
 import subprocess
+import sys
+from contextlib import contextmanager
 from json.decoder import JSONDecodeError
 
 from ..cache import CACHE_VALUES
@@ -70,8 +73,50 @@ def get_script_settings():
     Get the current cache Mass Payment Script Settings
     :return: Current Cache Mass Payment Script Setting object
     """
-    script_settings = CACHE_VALUES.get("settings")
+    script_settings = CACHE_VALUES.settings
     if script_settings is None:
         script_settings = MassPaymentsSettings()
-        CACHE_VALUES["settings"] = script_settings
+        CACHE_VALUES.settings = script_settings
     return script_settings
+
+
+def write_file_atomically(filename, content):
+    """
+    Writes the content in a temporary file before moving it to the target file,
+    so an interrupted write does not leave a partially written file behind
+    :param filename: Name of the target file
+    :param content: Bytes to be written in the file
+    :return:
+    """
+    temp_filename = f"{filename}.tmp"
+    try:
+        with open(temp_filename, "wb") as temp_file:
+            temp_file.write(content)
+        os.replace(temp_filename, filename)
+    except BaseException:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
+
+
+@contextmanager
+def script_error_guard(message, error_class=ScriptError, **error_details):
+    """
+    Raises unexpected errors of the wrapped block as script errors, script errors are
+    raised as they are
+    :param message: Message of the raised script error
+    :param error_class: Class of the raised script error
+    :param error_details: Additional arguments of the raised script error (e.g. file)
+    :return:
+    """
+    try:
+        yield
+    except ScriptError:
+        raise
+    except Exception as e:
+        raise error_class(
+            message=message,
+            error=e,
+            traceback=sys.exc_info(),
+            **error_details,
+        )
@@ -1,9 +1,9 @@
-import json
 import subprocess
 
+import orjson
 from pycardano import ChainContext, Network, ProtocolParameters
 
-from ..constants.commands import QUERY_PROTOCOL_PARAMETERS, QUERY_TIP
+from ..constants.commands import QUERY_PROTOCOL_PARAMETERS_ARGS, QUERY_TIP_ARGS
 from ..constants.common import CardanoNetwork, ScriptMethod
 from .common import get_script_settings, subprocess_popen
 
@@ -16,44 +16,36 @@ class CardanoCLIChainContext(ChainContext):
             if cardano_network == CardanoNetwork.MAINNET
             else Network.TESTNET
         )
-        self._network_command_flag = masspayments_settings.network_flag(cardano_network)
+        self._network_command_args = masspayments_settings.network_flag_args(
+            cardano_network,
+        )
         self.use_docker_cli = use_docker_cli
         self.command_prefix = masspayments_settings.command_prefix(
             ScriptMethod.METHOD_PYCARDANO,
             use_docker_cli,
         )
-        self.wallet_command_prefix = masspayments_settings.wallet_command_prefix(
+        self.command_prefix_args = masspayments_settings.command_prefix_args(
             ScriptMethod.METHOD_PYCARDANO,
             use_docker_cli,
         )
         self._service_name = "cli"
-        self._last_known_block_slot = 0
         self._genesis_param = None
         self._protocol_param = None
 
-    def _check_chain_tip_and_update(self):
-        slot = self.last_block_slot
-        if self._last_known_block_slot != slot:
-            self._last_known_block_slot = slot
-            return True
-        else:
-            return False
-
     @property
     def protocol_param(self) -> ProtocolParameters:
         """Get current protocol parameters"""
-        protocol_command = QUERY_PROTOCOL_PARAMETERS.format(
-            prefix=self.command_prefix,
-            network=self._network_command_flag,
-        )
-
-        if not self._protocol_param or self._check_chain_tip_and_update():
-            protocol_results = subprocess_popen(
-                protocol_command.split(),
+        # The context lives for a single script run, so the parameters are fetched once
+        if not self._protocol_param:
+            protocol_results, _ = subprocess_popen(
+                [
+                    *self.command_prefix_args,
+                    *QUERY_PROTOCOL_PARAMETERS_ARGS,
+                    *self._network_command_args,
+                ],
                 stdout=subprocess.PIPE,
-            ).stdout.read()
-            protocol_results_str = protocol_results.decode("utf-8")
-            protocol_details = json.loads(protocol_results_str)
+            ).communicate()
+            protocol_details = orjson.loads(protocol_results)
             param = ProtocolParameters(
                 min_fee_constant=protocol_details.get("txFeeFixed"),
                 min_fee_coefficient=protocol_details.get("txFeePerByte"),
@@ -111,15 +103,10 @@ class CardanoCLIChainContext(ChainContext):
     @property
     def last_block_slot(self) -> int:
         """Slot number of last block"""
-        tip_query_command = QUERY_TIP.format(
-            prefix=self.command_prefix,
-            network=self._network_command_flag,
-        )
-        tip_query_results = subprocess_popen(
-            tip_query_command.split(),
+        tip_query_results, _ = subprocess_popen(
+            [*self.command_prefix_args, *QUERY_TIP_ARGS, *self._network_command_args],
             stdout=subprocess.PIPE,
-        ).stdout.read()
-        tip_query_results_str = tip_query_results.decode("utf-8")
-        tip_query_details = json.loads(tip_query_results_str)
+        ).communicate()
+        tip_query_details = orjson.loads(tip_query_results)
 
         return tip_query_details.get("slot")
@@ -1,8 +1,8 @@
 import csv
 import math
 import os
-import traceback
-from copy import deepcopy
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from ..cache import CACHE_VALUES
 from ..classes import (
@@ -15,7 +15,9 @@ from ..classes import (
 from ..constants.commands import (
     CREATE_FILE_COPY_TO_DOCKER,
     DELETE_FILE,
+    DOCKER_PREFIX_VARIABLE,
     DUST_SUBMIT_FUNCTION_CALL,
+    DUST_TX_STATUS_SCRIPT,
     DUST_TX_SUBMIT_SCRIPT,
     FIND_PYTHON_FUNCTION,
     GROUP_TX_ONGOING_FUNCTION_CALL,
@@ -24,7 +26,7 @@ from ..constants.commands import (
     POST_PREP_TX_SUBMIT_SCRIPT,
     QUERY_TIP,
     QUERY_WALLET_UTXO_NO_FILE,
-    QUERY_WALLET_UTXO_VIA_TXID,
+    QUERY_WALLET_UTXO_VIA_TX_IN_FLAGS,
     STATUS_MESSAGE_SETUP,
     TRANSACTION_FEE,
     TRANSACTION_SIGN,
@@ -34,6 +36,11 @@ from ..constants.commands import (
     UPDATE_TRANSACTION_PLAN_FILE,
 )
 from ..constants.common import (
+    CARDANO_NETWORKS,
+    PENDING_TRANSACTION_STATUSES,
+    SCRIPT_METHODS,
+    TX_SIZE_PROBE_MAX_WORKERS,
+    UNFINISHED_TRANSACTION_STATUSES,
     CardanoNetwork,
     DustCollectionMethod,
     ScriptMethod,
@@ -135,7 +142,7 @@ def group_output_utxo(
         raise ScriptError(
             message="Unexpected Error Getting Protocol Parameters.",
             error=e,
-            traceback=traceback.format_exc(),
+            traceback=sys.exc_info(),
         )  # Error during protocol parameter fetch
 
     # Get Initial Transaction Byte Size
@@ -153,26 +160,48 @@ def group_output_utxo(
         raise ScriptError(
             message="Unexpected Error Getting TX Byte Size.",
             error=e,
-            traceback=traceback.format_exc(),
+            traceback=sys.exc_info(),
         )  # Error during Initial Transaction Byte Size Fetch
 
-    if initial_tx_size < max_tx_size:
+    if initial_tx_size <= max_tx_size:
         return [output_list]
 
-    bin_index = math.floor(num_output * max_tx_size / initial_tx_size)
-    max_tx_per_group_count = 0
-    while bin_index > 0:
+    # The transaction size grows about linearly with the number of outputs, so the
+    # group size is predicted from the last two measured sizes and each prediction is
+    # confirmed by building the transaction. A probe that does not halve the search
+    # range is followed by a bisection, keeping the probe count logarithmic.
+    max_tx_per_group_count = 0  # Largest output count known to fit
+    min_over_max_count = num_output  # Smallest output count known not to fit
+    last_count, last_tx_size = num_output, initial_tx_size
+    next_count = math.floor(num_output * max_tx_size / initial_tx_size)
+    while min_over_max_count - max_tx_per_group_count > 1:
+        next_count = min(
+            max(next_count, max_tx_per_group_count + 1),
+            min_over_max_count - 1,
+        )
         tx_size = get_transaction_byte_size(
             input_arg=1,
-            output_arg=output_list[: max_tx_per_group_count + bin_index],
+            output_arg=output_list[:next_count],
             method=method,
+            network=network,
         )
+        search_range = min_over_max_count - max_tx_per_group_count
         if tx_size > max_tx_size:
             # Fail
-            bin_index = math.floor(bin_index / 2)
+            min_over_max_count = next_count
         else:
             # Success
-            max_tx_per_group_count += bin_index
+            max_tx_per_group_count = next_count
+
+        size_per_output = (tx_size - last_tx_size) / (next_count - last_count)
+        last_count, last_tx_size = next_count, tx_size
+        if (
+            size_per_output > 0
+            and (min_over_max_count - max_tx_per_group_count) * 2 <= search_range
+        ):
+            next_count += math.floor((max_tx_size - tx_size) / size_per_output)
+        else:
+            next_count = (max_tx_per_group_count + min_over_max_count) // 2
 
     # Group Output UTxOs
     utxo_groups = []
@@ -241,7 +270,7 @@ def preparation_step(
             file=payments_utxo_file,
             message="Unexpected Error Parsing UTxO File.",
             error=e,
-            traceback=traceback.format_exc(),
+            traceback=sys.exc_info(),
         )  # Error during output file parsing
 
     # Get wallet utxos
@@ -259,7 +288,7 @@ def preparation_step(
         raise ScriptError(
             message="Unexpected Error Fetching Wallet UTxO.",
             error=e,
-            traceback=traceback.format_exc(),
+            traceback=sys.exc_info(),
             additional_context={"address": address},
         )  # Error during wallet utxo fetch
 
@@ -294,7 +323,7 @@ def preparation_step(
         raise ScriptError(
             message="Unexpected Error Grouping Output UTxOs.",
             error=e,
-            traceback=traceback.format_exc(),
+            traceback=sys.exc_info(),
         )  # Error during output group list generation
 
     # Get total amount of output groups
@@ -316,7 +345,7 @@ def preparation_step(
             raise ScriptError(
                 message="Unexpected Error Getting Total Amount and Fee.",
                 error=e,
-                traceback=traceback.format_exc(),
+                traceback=sys.exc_info(),
             )  # Error in total computation
         total_output_amount_list.append(total_amount_plus_fee)
         output_group_details.append(
@@ -380,7 +409,7 @@ def preparation_step(
         raise ScriptError(
             message="Unexpected Error Creating TX Draft.",
             error=e,
-            traceback=traceback.format_exc(),
+            traceback=sys.exc_info(),
         )  # Error on transaction draft creation
 
     # Get max tx size
@@ -393,7 +422,7 @@ def preparation_step(
         raise ScriptError(
             message="Unexpected Error Fetching Protocol Parameters.",
             error=e,
-            traceback=traceback.format_exc(),
+            traceback=sys.exc_info(),
         )  # Error during protocol parameter fetch
 
     tx_size = get_tx_size(tx_file=transaction_draft_file, method=method)
@@ -477,14 +506,14 @@ def dust_collect(
             type=type(reward_details),
             message="Invalid Reward Details Type.",
         )
-    if network not in [cn for cn in CardanoNetwork]:
+    if network not in CARDANO_NETWORKS:
         raise InvalidNetwork(network=network)
-    if method not in [sm for sm in ScriptMethod]:
+    if method not in SCRIPT_METHODS:
         raise InvalidMethod(method=method)
 
     print_to_console(
         message="Creating Dust Collected UTxOs...",
-        output_format=CACHE_VALUES.get("output_format"),
+        output_format=CACHE_VALUES.output_format,
     )
     new_wallet_utxos = []
     dust_utxos = []
@@ -709,17 +738,38 @@ def adjust_utxos(
         while len(utxo_details_list) > 0:
             temp_utxo_list.append(utxo_details_list.pop(0))
 
-    for o_group_detail in output_utxo_details:
-        # ttl = get_latest_slot_number(network=network, method=method) + allow_ttl_slots
-        output_group_utxo_list = o_group_detail.payment_details
-        if len(output_group_utxo_list) == 0:
-            continue
-        tx_size = get_transaction_byte_size(
+    # ttl = get_latest_slot_number(network=network, method=method) + allow_ttl_slots
+    sized_group_details = [
+        o_group_detail
+        for o_group_detail in output_utxo_details
+        if len(o_group_detail.payment_details) > 0
+    ]
+
+    def get_group_tx_size(o_group_detail):
+        return get_transaction_byte_size(
             input_arg=1,
-            output_arg=output_group_utxo_list,
+            output_arg=o_group_detail.payment_details,
             method=method,
             network=network,
         )
+
+    if method in [ScriptMethod.METHOD_DOCKER_CLI, ScriptMethod.METHOD_HOST_CLI]:
+        # CLI groups are built and measured by independent cardano-cli processes, so
+        # they are measured concurrently
+        with ThreadPoolExecutor(
+            max_workers=max(
+                1,
+                min(TX_SIZE_PROBE_MAX_WORKERS, len(sized_group_details)),
+            ),
+        ) as executor:
+            group_tx_sizes = list(executor.map(get_group_tx_size, sized_group_details))
+    else:
+        # Pycardano builds and signs in Python, threads would only contend for the GIL
+        group_tx_sizes = [
+            get_group_tx_size(o_group_detail) for o_group_detail in sized_group_details
+        ]
+
+    for o_group_detail, tx_size in zip(sized_group_details, group_tx_sizes):
         o_group_detail.tx_size = tx_size
         if tx_size > max_tx_size:
             over_max_group.append(o_group_detail)
@@ -796,7 +846,7 @@ def adjust_utxos(
         raise InvalidFileError(
             message="Unexpected Error Deleting Prep TX File.",
             error=e,
-            traceback=traceback.format_exc(),
+            traceback=sys.exc_info(),
             file=prep_tx_file,
         )  # Error during delete transaction draft file
 
@@ -816,7 +866,7 @@ def adjust_utxos(
 
     # Test on prep utxo
     temp_utxo_index = len(temp_utxo_list)
-    final_prep_list = deepcopy(prep_utxo_detail_list)
+    final_prep_list = list(prep_utxo_detail_list)  # PaymentDetails are immutable
     final_input_list = []
     extra_group_details = PaymentGroup(index=len(prep_utxo_detail_list))
     initial_round = True
@@ -900,7 +950,7 @@ def adjust_utxos(
                     print_to_console(
                         message=f"Change amounting to {change_amount} Lovelace will be added to fee. Fee is now "
                         f"{temp_o_fee} Lovelace",
-                        output_format=CACHE_VALUES.get("output_format"),
+                        output_format=CACHE_VALUES.output_format,
                     )
                 break
             else:
@@ -1044,13 +1094,21 @@ def generate_bash_script(
     for input_utxo in prep_input_utxos:
         input_address_set.add(input_utxo.address)
 
-    pycardano_context = CACHE_VALUES.get("pycardano_context")
+    pycardano_context = CACHE_VALUES.pycardano_context
 
     prefix = masspayments_settings.command_prefix(method)
     if method == ScriptMethod.METHOD_PYCARDANO:
         prefix = pycardano_context.command_prefix
     network_flag = masspayments_settings.network_flag(network)
 
+    # The docker exec prefix is declared once and the commands refer to its variable
+    docker_prefix = masspayments_settings.command_prefix(ScriptMethod.METHOD_DOCKER_CLI)
+    if method in [ScriptMethod.METHOD_DOCKER_CLI, ScriptMethod.METHOD_PYCARDANO]:
+        bash_script_list.append(f'{DOCKER_PREFIX_VARIABLE}="{docker_prefix.strip()}"')
+        docker_prefix = f"${DOCKER_PREFIX_VARIABLE} "
+        if prefix:
+            prefix = docker_prefix
+
     # Additional Metadata File Command
     metadata_copy_command = None
     metadata_remove_command = None
@@ -1067,7 +1125,7 @@ def generate_bash_script(
         metadata_copy_command = CREATE_FILE_COPY_TO_DOCKER.format(
             source_filename=metadata_file,
             filename=metadata_copy_filename,
-            prefix=masspayments_settings.command_prefix(ScriptMethod.METHOD_DOCKER_CLI),
+            prefix=docker_prefix,
         )
         metadata_remove_command = DELETE_FILE.format(
             prefix=prefix,
@@ -1096,16 +1154,12 @@ def generate_bash_script(
                     CREATE_FILE_COPY_TO_DOCKER.format(
                         source_filename=old_signing_key_file,
                         filename=new_signing_key_file,
-                        prefix=masspayments_settings.command_prefix(
-                            ScriptMethod.METHOD_DOCKER_CLI,
-                        ),
+                        prefix=docker_prefix,
                     ),
                 )
                 signing_key_file_delete_command_list.add(
                     DELETE_FILE.format(
-                        prefix=masspayments_settings.command_prefix(
-                            ScriptMethod.METHOD_DOCKER_CLI,
-                        ),
+                        prefix=docker_prefix,
                         filename=new_signing_key_file,
                     ),
                 )
@@ -1134,12 +1188,11 @@ def generate_bash_script(
                         input_utxo.tx_hash = (
                             f"$txid_{tx_uuid}_dust_{target_address}_{dust_order-1}"
                         )
-                dust_signing_file_parameters = []
-                for address in dust_input_witnesses:
-                    for dust_sk_file in signing_key_file_details[address]:
-                        dust_signing_file_parameters.append(
-                            f"--signing-key-file {dust_sk_file}",
-                        )
+                dust_signing_key_files = [
+                    dust_sk_file
+                    for address in dust_input_witnesses
+                    for dust_sk_file in signing_key_file_details[address]
+                ]
                 dust_command_details.append(
                     {
                         "create_command": create_transaction_command(
@@ -1155,9 +1208,8 @@ def generate_bash_script(
                         "sign_command": TRANSACTION_SIGN.format(
                             prefix=prefix,
                             raw_file=f"{dust_prep_filename}.raw",
-                            signing_key_file_details=" ".join(
-                                dust_signing_file_parameters,
-                            ),
+                            signing_key_file_details="--signing-key-file "
+                            + " --signing-key-file ".join(dust_signing_key_files),
                             network=network_flag,
                             signed_file=f"{dust_prep_filename}.signed",
                         ),
@@ -1176,10 +1228,7 @@ def generate_bash_script(
                         )
                         + ")"
                         if dust_prep_detail.submission_status
-                        in [
-                            TransactionStatus.NOT_YET_SUBMITTED,
-                            TransactionStatus.TTL_EXPIRED,
-                        ]
+                        in PENDING_TRANSACTION_STATUSES
                         else f'{dust_txid_variable}="{dust_prep_detail.tx_hash_id}"',
                     },
                 )
@@ -1197,10 +1246,7 @@ def generate_bash_script(
             dust_tx_var = f"$txid_{tx_uuid}_dust_{input_utxo.address}_{dust_command_details['latest_dust_order']}"
             input_utxo.tx_hash = dust_tx_var
 
-    if prep_tx_submission_status in [
-        TransactionStatus.NOT_YET_SUBMITTED,
-        TransactionStatus.TTL_EXPIRED,
-    ]:
+    if prep_tx_submission_status in PENDING_TRANSACTION_STATUSES:
         prep_draft_filename = f"{tx_uuid}_prep.draft"
         prep_tx_draft_command = create_transaction_command(
             input_arg=prep_input_utxos,
@@ -1212,13 +1258,11 @@ def generate_bash_script(
         )
 
         # Get Prep TX Fee
-        signing_file_commands_list = []
-
-        for address in input_address_set:
-            for address_sk_file in signing_key_file_details[address]:
-                signing_file_commands_list.append(
-                    f"--signing-key-file {address_sk_file}",
-                )
+        prep_signing_key_files = [
+            address_sk_file
+            for address in input_address_set
+            for address_sk_file in signing_key_file_details[address]
+        ]
         protocol_filename = (
             "mainnet-protocol.json"
             if network == CardanoNetwork.MAINNET
@@ -1231,7 +1275,7 @@ def generate_bash_script(
             num_output=len(prep_output_utxos),
             network=network_flag,
             protocol_file=protocol_filename,
-            num_witness=len(signing_file_commands_list),
+            num_witness=len(prep_signing_key_files),
         )
 
         # Create Raw Prep TX File
@@ -1277,7 +1321,8 @@ def generate_bash_script(
             TRANSACTION_SIGN.format(
                 prefix=prefix,
                 raw_file=raw_file,
-                signing_key_file_details=" ".join(signing_file_commands_list),
+                signing_key_file_details="--signing-key-file "
+                + " --signing-key-file ".join(prep_signing_key_files),
                 network=network_flag,
                 signed_file=prep_signed_filename,
             ),
@@ -1310,10 +1355,9 @@ def generate_bash_script(
     group_tx_sign_commands = []
     group_tx_submit_commands = []
     group_tx_allowed_index_list = []
-    group_sk_file_param_list = []
-    for group_sk_file in signing_key_file_details[source_address]:
-        group_sk_file_param_list.append(f"--signing-key-file {group_sk_file}")
-    group_signing_key_parameter = " ".join(group_sk_file_param_list)
+    group_signing_key_parameter = "--signing-key-file " + " --signing-key-file ".join(
+        signing_key_file_details[source_address],
+    )
     group_tx_ongoing_commands = []
     for group_detail in group_details_list:
         group_index = group_detail.index
@@ -1325,15 +1369,8 @@ def generate_bash_script(
                 amount=0,
             ),  # amount and address are not required here as the generated script only uses tx_hash and tx_index
         ]
-        if group_detail.submission_status in [
-            TransactionStatus.NOT_YET_SUBMITTED,
-            TransactionStatus.TTL_EXPIRED,
-            TransactionStatus.SUBMISSION_ONGOING,
-        ]:
-            if group_detail.submission_status in [
-                TransactionStatus.NOT_YET_SUBMITTED,
-                TransactionStatus.TTL_EXPIRED,
-            ]:
+        if group_detail.submission_status in UNFINISHED_TRANSACTION_STATUSES:
+            if group_detail.submission_status in PENDING_TRANSACTION_STATUSES:
                 group_tx_raw_command = create_transaction_command(
                     input_arg=group_input_utxos,
                     output_arg=group_detail.payment_details,
@@ -1393,10 +1430,7 @@ def generate_bash_script(
             )
         bash_script_list += list(signing_key_file_setup_command_list)
 
-    if prep_tx_submission_status in [
-        TransactionStatus.NOT_YET_SUBMITTED,
-        TransactionStatus.TTL_EXPIRED,
-    ]:
+    if prep_tx_submission_status in PENDING_TRANSACTION_STATUSES:
         if dust_commands:
             if add_comments:
                 bash_script_list += add_bash_comment("# Create Dust UTxOs")
@@ -1499,91 +1533,78 @@ def generate_bash_script(
         ),
     )
 
-    if dust_commands:
-        dust_not_yet_submitted = 0
-        for target_address in dust_commands:
-            dust_command_list = dust_commands[target_address]
-            map_index = 0
-            for dust_command_detail in dust_command_list["command_details"]:
-                if dust_command_detail["submission_status"] in [
-                    TransactionStatus.NOT_YET_SUBMITTED,
-                    TransactionStatus.TTL_EXPIRED,
-                ]:
-                    dust_not_yet_submitted += 1
-
-        if dust_not_yet_submitted > 0:
-            if add_comments:
-                bash_script_list += add_bash_comment(
-                    "# Function for handling Dust Transaction Submission",
-                )
+    dust_submit_calls = [
+        DUST_SUBMIT_FUNCTION_CALL.format(
+            signed_file_name=dust_command_detail["signed_tx_filename"],
+            target_address=target_address,
+            txid_variable_name=f"${dust_command_detail['dust_txid_variable_name']}",
+            map_index=map_index,
+            straight_to_poll=str(
+                dust_command_detail["submission_status"]
+                == TransactionStatus.SUBMISSION_ONGOING,
+            ).lower(),
+        )
+        for target_address in dust_commands
+        for map_index, dust_command_detail in enumerate(
+            dust_commands[target_address]["command_details"],
+        )
+        if dust_command_detail["submission_status"] in UNFINISHED_TRANSACTION_STATUSES
+    ]
+    if dust_submit_calls:
+        if add_comments:
+            bash_script_list += add_bash_comment(
+                "# Function for handling Dust Transaction Submission",
+            )
 
-            bash_script_list.append(
-                DUST_TX_SUBMIT_SCRIPT.format(
-                    polling_arg_index=5,
-                    dust_submit_command=TRANSACTION_SUBMIT.format(
-                        prefix=prefix,
-                        signed_file="$1",
-                        network=network_flag,
-                    ),
-                    utxo_query_command=QUERY_WALLET_UTXO_NO_FILE.format(
-                        prefix=prefix,
-                        address="$2",
-                        network=network_flag,
-                    ),
-                    function_index_txid=3,
-                    ongoing_status_command=UPDATE_TRANSACTION_PLAN_FILE.format(
-                        transaction_plan_filename=transaction_plan.filename,
-                        python_update_command=f"data['dust_group_details']['$2'][$4]['submission_status']="
-                        f"'{TransactionStatus.SUBMISSION_ONGOING.value}';"
-                        f"data['dust_group_details']['$2'][$4]['tx_hash_id']='$3'",
-                        python_exec_str="$python_exec_str",
-                    ),
-                    expired_status_command=UPDATE_TRANSACTION_PLAN_FILE.format(
-                        transaction_plan_filename=transaction_plan.filename,
-                        python_update_command=f"data['dust_group_details']['$2'][$4]['submission_status']="
-                        f"'{TransactionStatus.TTL_EXPIRED.value}'",
-                        python_exec_str="$python_exec_str",
-                    ),
-                    success_status_command=UPDATE_TRANSACTION_PLAN_FILE.format(
-                        transaction_plan_filename=transaction_plan.filename,
-                        python_update_command=f"data['dust_group_details']['$2'][$4]['submission_status']="
-                        f"'{TransactionStatus.SUBMISSION_DONE.value}';"
-                        f"data['dust_group_details']['$2'][$4]['tx_hash_id']='$3'",
-                        python_exec_str="$python_exec_str",
-                    ),
-                    ttl=ttl,
+        bash_script_list.append(
+            DUST_TX_SUBMIT_SCRIPT.format(
+                polling_arg_index=5,
+                dust_submit_command=TRANSACTION_SUBMIT.format(
+                    prefix=prefix,
+                    signed_file="$1",
+                    network=network_flag,
                 ),
-            )
-        for target_address in dust_commands:
-            dust_command_list = dust_commands[target_address]
-            map_index = 0
-            for dust_command_detail in dust_command_list["command_details"]:
-                if dust_command_detail["submission_status"] in [
-                    TransactionStatus.NOT_YET_SUBMITTED,
-                    TransactionStatus.TTL_EXPIRED,
-                    TransactionStatus.SUBMISSION_ONGOING,
-                ]:
-                    bash_script_list.append(
-                        DUST_SUBMIT_FUNCTION_CALL.format(
-                            signed_file_name=dust_command_detail["signed_tx_filename"],
-                            target_address=target_address,
-                            txid_variable_name=f"${dust_command_detail['dust_txid_variable_name']}",
-                            map_index=map_index,
-                            straight_to_poll=str(
-                                dust_command_detail["submission_status"]
-                                == TransactionStatus.SUBMISSION_ONGOING,
-                            ).lower(),
-                        ),
-                    )
-                map_index += 1
-            if dust_not_yet_submitted > 0:
-                bash_script_list.append('echo "Dust Transactions Submission Done"')
-
-    if prep_tx_submission_status in [
-        TransactionStatus.NOT_YET_SUBMITTED,
-        TransactionStatus.TTL_EXPIRED,
-        TransactionStatus.SUBMISSION_ONGOING,
-    ]:
+                function_index_txid=3,
+                ongoing_status_command=UPDATE_TRANSACTION_PLAN_FILE.format(
+                    transaction_plan_filename=transaction_plan.filename,
+                    python_update_command=f"data['dust_group_details']['$2'][$4]['submission_status']="
+                    f"'{TransactionStatus.SUBMISSION_ONGOING.value}';"
+                    f"data['dust_group_details']['$2'][$4]['tx_hash_id']='$3'",
+                    python_exec_str="$python_exec_str",
+                ),
+            ),
+        )
+        # Submit all the dust transactions first, then wait for them together
+        bash_script_list += dust_submit_calls
+
+        if add_comments:
+            bash_script_list += add_bash_comment("# Wait for the Dust Transactions")
+        bash_script_list.append(
+            DUST_TX_STATUS_SCRIPT.format(
+                utxo_query_command=QUERY_WALLET_UTXO_NO_FILE.format(
+                    prefix=prefix,
+                    address="$dust_address",
+                    network=network_flag,
+                ),
+                expired_status_command=UPDATE_TRANSACTION_PLAN_FILE.format(
+                    transaction_plan_filename=transaction_plan.filename,
+                    python_update_command="data['dust_group_details']['$dust_address'][$dust_map_index]"
+                    f"['submission_status']='{TransactionStatus.TTL_EXPIRED.value}'",
+                    python_exec_str="$python_exec_str",
+                ),
+                success_status_command=UPDATE_TRANSACTION_PLAN_FILE.format(
+                    transaction_plan_filename=transaction_plan.filename,
+                    python_update_command="data['dust_group_details']['$dust_address'][$dust_map_index]"
+                    f"['submission_status']='{TransactionStatus.SUBMISSION_DONE.value}';"
+                    "data['dust_group_details']['$dust_address'][$dust_map_index]"
+                    "['tx_hash_id']='$dust_txid'",
+                    python_exec_str="$python_exec_str",
+                ),
+                ttl=ttl,
+            ),
+        )
+
+    if prep_tx_submission_status in UNFINISHED_TRANSACTION_STATUSES:
         if add_comments:
             bash_script_list += add_bash_comment(
                 "# Submit the Preparation Transaction Signed Files",
@@ -1663,10 +1684,9 @@ def generate_bash_script(
                 ),
                 utxo_index_array_str=" ".join(group_tx_allowed_index_list),
                 prep_txid_variable="prep_txid",
-                utxo_query_command=QUERY_WALLET_UTXO_VIA_TXID.format(
+                utxo_query_command=QUERY_WALLET_UTXO_VIA_TX_IN_FLAGS.format(
                     prefix=prefix,
-                    tx_hash="$prep_txid",
-                    tx_index="$group_index",
+                    tx_in_flags="$tx_in_flags",
                     network=network_flag,
                 ),
                 ttl=ttl,
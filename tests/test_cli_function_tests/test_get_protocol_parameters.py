@@ -1,8 +1,10 @@
+import os
+import tempfile
 from copy import deepcopy
 from unittest import TestCase
 from unittest.mock import patch
 
-from cardano_mass_payments.constants.common import CardanoNetwork
+from cardano_mass_payments.constants.common import CardanoNetwork, ScriptMethod
 from cardano_mass_payments.constants.exceptions import (
     InvalidMethod,
     InvalidNetwork,
@@ -97,3 +99,34 @@ class TestProcess(TestCase):
 
         assert testnet_result == "testnet-protocol.json"
         assert mainnet_result == "mainnet-protocol.json"
+
+    def test_fresh_file_of_another_network_is_not_reused(self):
+        mock_responses = deepcopy(MOCK_TEST_RESPONSES)
+        mock_responses[("query", "protocol-parameters")] = MOCK_PROTOCOL_PARAMETERS
+        current_directory = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_directory, patch(
+            "cardano_mass_payments.utils.cli_utils.subprocess_popen",
+            side_effect=generate_mock_popen_function(mock_responses),
+        ) as mock_popen:
+            os.chdir(temp_directory)
+            try:
+                # Fresh file left by a preprod run
+                with open("testnet-protocol.json", "w") as file:
+                    file.write("{}")
+
+                result = get_protocol_parameters(
+                    network=CardanoNetwork.PREVIEW,
+                    method=ScriptMethod.METHOD_HOST_CLI,
+                    return_file=True,
+                )
+            finally:
+                os.chdir(current_directory)
+
+        assert result == "testnet-protocol.json"
+        query_commands = [
+            call.args[0]
+            for call in mock_popen.call_args_list
+            if "protocol-parameters" in call.args[0]
+        ]
+        assert len(query_commands) == 1
+        assert "--testnet-magic" in query_commands[0]
@@ -2,7 +2,9 @@ from copy import deepcopy
 from unittest import TestCase
 from unittest.mock import patch
 
+from cardano_mass_payments.cache import CACHE_VALUES
 from cardano_mass_payments.classes import InputUTXO, PaymentDetail
+from cardano_mass_payments.constants.common import ScriptMethod
 from cardano_mass_payments.constants.exceptions import (
     EmptyList,
     InvalidMethod,
@@ -11,6 +13,7 @@ from cardano_mass_payments.constants.exceptions import (
     ScriptError,
 )
 from cardano_mass_payments.utils.cli_utils import get_total_amount_plus_fee
+from cardano_mass_payments.utils.common import get_script_settings
 from tests.mock_responses import MOCK_TEST_RESPONSES
 from tests.mock_utils import (
     INVALID_STRING_TYPE,
@@ -349,3 +352,86 @@ class TestProcess(TestCase):
 
         assert isinstance(result, tuple)
         assert result == (5000, 100)
+
+    def test_draft_fee_reused_with_query_cache(self):
+        mock_responses = deepcopy(MOCK_TEST_RESPONSES)
+        mock_responses.update(
+            {
+                "build-raw": {},
+                "rm": {},
+                "calculate-min-fee": "100 Lovelace",
+                ("query", "protocol-parameters"): MOCK_PROTOCOL_PARAMETERS,
+            },
+        )
+
+        def count_fee_commands(mock_popen):
+            return sum(
+                "calculate-min-fee" in call.args[0]
+                for call in mock_popen.call_args_list
+            )
+
+        masspayments_settings = get_script_settings()
+        masspayments_settings.enable_query_cache()
+        try:
+            with patch(
+                "cardano_mass_payments.utils.cli_utils.subprocess_popen",
+                side_effect=generate_mock_popen_function(mock_responses),
+            ) as mock_popen, patch.dict(CACHE_VALUES, {"metadata_file": None}):
+                first_result = get_total_amount_plus_fee(
+                    input_arg=1,
+                    output_list=[PaymentDetail(address="test_address", amount=1000)],
+                )
+                # CLI drafts zero the output amounts, so only the addresses matter
+                second_result = get_total_amount_plus_fee(
+                    input_arg=1,
+                    output_list=[PaymentDetail(address="test_address", amount=2000)],
+                )
+                assert count_fee_commands(mock_popen) == 1
+
+                get_total_amount_plus_fee(
+                    input_arg=1,
+                    output_list=[PaymentDetail(address="other_address", amount=1000)],
+                )
+                assert count_fee_commands(mock_popen) == 2
+
+                with patch.dict(CACHE_VALUES, {"metadata_file": "metadata.json"}):
+                    get_total_amount_plus_fee(
+                        input_arg=1,
+                        output_list=[
+                            PaymentDetail(address="test_address", amount=1000),
+                        ],
+                    )
+                assert count_fee_commands(mock_popen) == 3
+        finally:
+            masspayments_settings.reset_query_cache()
+
+        assert first_result == (1000, 100)
+        assert second_result == (2000, 100)
+
+    def test_draft_fee_cache_keeps_pycardano_amounts(self):
+        masspayments_settings = get_script_settings()
+        masspayments_settings.enable_query_cache()
+        try:
+            with patch(
+                "cardano_mass_payments.utils.cli_utils.create_transaction_file",
+                return_value={},
+            ), patch(
+                "cardano_mass_payments.utils.cli_utils.get_transaction_fee",
+                return_value=100,
+            ) as mock_fee, patch(
+                "cardano_mass_payments.utils.cli_utils.delete_temp_file",
+                return_value=True,
+            ):
+                for amount in [1000, 1000, 2000]:
+                    get_total_amount_plus_fee(
+                        input_arg=1,
+                        output_list=[
+                            PaymentDetail(address="test_address", amount=amount),
+                        ],
+                        method=ScriptMethod.METHOD_PYCARDANO,
+                    )
+        finally:
+            masspayments_settings.reset_query_cache()
+
+        # Pycardano drafts carry the amounts, so a different amount is a new draft
+        assert mock_fee.call_count == 2
@@ -2,6 +2,7 @@ import argparse
 import json
 import os
 import stat
+import subprocess
 import tempfile
 from copy import deepcopy
 from unittest import TestCase
@@ -1606,3 +1607,287 @@ class TestProcess(TestCase):
         os.remove(f"{transaction_plan.uuid}.sh")
         source_file.close()
         payment_file.close()
+
+    def test_adjust_metadata_message_keeps_every_word(self):
+        message_line = "word " * 20 + "z" * 100
+
+        result = adjust_metadata_message([message_line])
+
+        assert result == [
+            " ".join(["word"] * 13),
+            " ".join(["word"] * 7) + " " + "z" * 29,
+            "z" * 64,
+            "z" * 7,
+        ]
+        assert all(len(line.encode("utf-8")) <= 64 for line in result)
+
+    def test_adjust_metadata_message_multibyte_cut(self):
+        result = adjust_metadata_message(["é" * 40])
+
+        # Two bytes per character, so the cut never lands inside a character
+        assert result == ["é" * 32, "é" * 8]
+
+    def test_adjust_metadata_message_word_order_after_overflow(self):
+        message_line = "aaa " * 10 + "b" * 70 + " c d"
+
+        result = adjust_metadata_message([message_line])
+
+        assert result == [
+            " ".join(["aaa"] * 10) + " " + "b" * 24,
+            "b" * 46 + " c d",
+        ]
+
+    def test_adjust_metadata_message_oversized_first_character(self):
+        result = adjust_metadata_message(["hi é x", "é"], max_bytes=1)
+
+        # Characters bigger than the maximum bytes are dropped without empty lines
+        assert result == ["h", "i", "x"]
+
+    def test_group_status_checks_all_groups_in_one_query(self):
+        payment_file = create_test_payment_csv(30)
+        source_file = self.create_test_source_csv()
+
+        mock_responses = deepcopy(MOCK_TEST_RESPONSES)
+        mock_responses[("cat", f"/tmp-files/utxo-{MOCK_FULL_ADDRESS}.json")] = {
+            "85d0364b65cd68e259cd93a33253e322a0d02a67338f85dc1b67b09791e35905#1": {
+                "address": MOCK_FULL_ADDRESS,
+                "value": {"lovelace": 1000000000},
+            },
+        }
+        mock_responses["calculate-min-fee"] = "100 Lovelace"
+        mock_responses[("query", "tip")] = {"slot": 1}
+        mock_responses[("query", "protocol-parameters")] = MOCK_PROTOCOL_PARAMETERS
+
+        command_arguments = self.generate_command_arguments(
+            sources_csv=source_file.name,
+            payments_csv=payment_file.name,
+        )
+
+        with patch(
+            "cardano_mass_payments.utils.cli_utils.subprocess_popen",
+            side_effect=generate_mock_popen_function(mock_responses),
+        ), patch(
+            "cardano_mass_payments.utils.cli_utils.sign_tx_file",
+            side_effect=mock_sign_tx_file_cli,
+        ):
+            transaction_plan = generate_script_process(command_arguments)
+
+        with open(f"{transaction_plan.uuid}.sh") as script_file:
+            bash_script = script_file.read()
+
+        # One --tx-in flag per ongoing group, queried together
+        assert (
+            'tx_in_flags+=" --tx-in ${prep_txid}#${group_index_array[$i]}"'
+            in bash_script
+        )
+        assert "cardano-cli query utxo $tx_in_flags" in bash_script
+        pattern_line = next(
+            line.strip()
+            for line in bash_script.splitlines()
+            if line.strip().startswith("group_utxo_pattern=")
+        )
+        assert pattern_line == (
+            'group_utxo_pattern="${prep_txid}(#|[[:space:]]+)${group_index}([^0-9]|$)"'
+        )
+
+        # Group 10 is still unspent, group 1 must not match it
+        prep_txid = "85d0364b65cd68e259cd93a33253e322a0d02a67338f85dc1b67b09791e35905"
+        utxo_results_list = [
+            f"{prep_txid}     10        1000000 lovelace + TxOutDatumNone",
+            json.dumps({f"{prep_txid}#10": {"value": {"lovelace": 1000000}}}),
+        ]
+        check_script = "\n".join(
+            [
+                "prep_txid=$1",
+                "group_index=$2",
+                "group_utxo_results=$3",
+                pattern_line,
+                "if [[ $group_utxo_results =~ $group_utxo_pattern ]] ; then",
+                "    echo unspent",
+                "else",
+                "    echo spent",
+                "fi",
+            ],
+        )
+        for utxo_results in utxo_results_list:
+            for group_index, expected_status in [("1", "spent"), ("10", "unspent")]:
+                check_result = subprocess.run(
+                    [
+                        "bash",
+                        "-c",
+                        check_script,
+                        "bash",
+                        prep_txid,
+                        group_index,
+                        utxo_results,
+                    ],
+                    stdout=subprocess.PIPE,
+                )
+                assert check_result.stdout.decode().strip() == expected_status
+
+        os.remove(transaction_plan.filename)
+        os.remove(f"{transaction_plan.uuid}.sh")
+        source_file.close()
+        payment_file.close()
+
+    def test_dust_transactions_submitted_before_status_check(self):
+        payment_file = create_test_payment_csv(1000)
+        source_file = self.create_test_source_csv()
+
+        mock_responses = deepcopy(MOCK_TEST_RESPONSES)
+        mock_responses["calculate-min-fee"] = "100 Lovelace"
+        mock_input_details = {}
+        for i in range(100):
+            mock_input_details[
+                f"85d0364b65cd68e259cd93a33253e322a0d02a67338f85dc1b67b09791e35905#{i}"
+            ] = {
+                "address": MOCK_FULL_ADDRESS,
+                "value": {"lovelace": 2000000},
+            }
+        mock_responses[("cat", f"/tmp-files/utxo-{MOCK_FULL_ADDRESS}.json")] = mock_input_details
+        mock_responses[("query", "tip")] = {"slot": 1}
+        mock_parameters = deepcopy(MOCK_PROTOCOL_PARAMETERS)
+        mock_responses[("query", "protocol-parameters")] = mock_parameters
+
+        command_arguments = self.generate_command_arguments(
+            sources_csv=source_file.name,
+            payments_csv=payment_file.name,
+            enable_dust_collection=True,
+        )
+
+        with patch(
+            "cardano_mass_payments.utils.cli_utils.subprocess_popen",
+            side_effect=generate_mock_popen_function(mock_responses),
+        ), patch(
+            "cardano_mass_payments.utils.cli_utils.sign_tx_file",
+            side_effect=mock_sign_tx_file_cli,
+        ):
+            transaction_plan = generate_script_process(command_arguments)
+
+        with open(f"{transaction_plan.uuid}.sh") as script_file:
+            bash_script = script_file.read()
+
+        # Every dust transaction is submitted before the single status loop
+        script_lines = bash_script.splitlines()
+        submit_call_indexes = [
+            index
+            for index, line in enumerate(script_lines)
+            if line.startswith("dust_submit_function ")
+            and not line.startswith("dust_submit_function ()")
+        ]
+        status_indexes = [
+            index
+            for index, line in enumerate(script_lines)
+            if line == "dust_length=${#dust_txid_array[@]}"
+        ]
+        assert submit_call_indexes
+        assert len(status_indexes) == 1
+        assert max(submit_call_indexes) < status_indexes[0]
+        assert 'for dust_address in "${dust_address_array[@]}"' in bash_script
+
+        # Target addresses are stored once, each transaction keeps its index
+        function_start = bash_script.index("dust_txid_array=()")
+        function_end = bash_script.index("\n}\n", function_start) + 3
+        check_script = "\n".join(
+            [
+                "python_exec_str=true",
+                bash_script[function_start:function_end],
+                "dust_submit_function tx_0.signed addr_a txid_0 0 true",
+                "dust_submit_function tx_1.signed addr_b txid_1 0 true",
+                "dust_submit_function tx_2.signed addr_a txid_2 1 true",
+                'echo "${dust_address_array[*]}|${dust_address_index_array[*]}|'
+                '${dust_map_index_array[*]}|${dust_txid_array[*]}"',
+            ],
+        )
+        check_result = subprocess.run(
+            ["bash", "-c", check_script],
+            stdout=subprocess.PIPE,
+        )
+        assert (
+            check_result.stdout.decode().strip()
+            == "addr_a addr_b|0 1 0|0 0 1|txid_0 txid_1 txid_2"
+        )
+
+        os.remove(transaction_plan.filename)
+        os.remove(f"{transaction_plan.uuid}.sh")
+        source_file.close()
+        payment_file.close()
+
+    def test_dust_chain_confirmed_by_later_transaction(self):
+        payment_file = create_test_payment_csv(1000)
+        source_file = self.create_test_source_csv()
+
+        mock_responses = deepcopy(MOCK_TEST_RESPONSES)
+        mock_responses["calculate-min-fee"] = "100 Lovelace"
+        mock_input_details = {}
+        for i in range(100):
+            mock_input_details[
+                f"85d0364b65cd68e259cd93a33253e322a0d02a67338f85dc1b67b09791e35905#{i}"
+            ] = {
+                "address": MOCK_FULL_ADDRESS,
+                "value": {"lovelace": 2000000},
+            }
+        mock_responses[("cat", f"/tmp-files/utxo-{MOCK_FULL_ADDRESS}.json")] = mock_input_details
+        mock_responses[("query", "tip")] = {"slot": 1}
+        mock_parameters = deepcopy(MOCK_PROTOCOL_PARAMETERS)
+        mock_responses[("query", "protocol-parameters")] = mock_parameters
+
+        command_arguments = self.generate_command_arguments(
+            sources_csv=source_file.name,
+            payments_csv=payment_file.name,
+            enable_dust_collection=True,
+        )
+
+        with patch(
+            "cardano_mass_payments.utils.cli_utils.subprocess_popen",
+            side_effect=generate_mock_popen_function(mock_responses),
+        ), patch(
+            "cardano_mass_payments.utils.cli_utils.sign_tx_file",
+            side_effect=mock_sign_tx_file_cli,
+        ):
+            transaction_plan = generate_script_process(command_arguments)
+
+        with open(f"{transaction_plan.uuid}.sh") as script_file:
+            bash_script = script_file.read()
+
+        function_start = bash_script.index("dust_txid_array=()")
+        function_end = bash_script.index("\n}\n", function_start) + 3
+        status_start = bash_script.index("dust_length=${#dust_txid_array[@]}")
+        status_end = bash_script.index(
+            'echo "Dust Transactions Submission Done"',
+            status_start,
+        )
+        # Only the last transaction of the chain is still unspent, the outputs of
+        # the earlier ones were already spent by the next transaction
+        check_script = "\n".join(
+            [
+                "python_exec_str=true",
+                "ongoing_str=ongoing",
+                "success_str=success",
+                "ttl_expired_str=expired",
+                "get_latest_slot_no () { echo 0; }",
+                'cardano-cli () { echo "txid_2#0 1000000 lovelace"; }',
+                'docker () { echo "txid_2#0 1000000 lovelace"; }',
+                "sleep () { :; }",
+                bash_script[function_start:function_end],
+                "dust_submit_function tx_0.signed addr_a txid_0 0 true",
+                "dust_submit_function tx_1.signed addr_a txid_1 1 true",
+                "dust_submit_function tx_2.signed addr_a txid_2 2 true",
+                bash_script[status_start:status_end],
+                'echo "${dust_status_array[*]}|$dust_expired_count"',
+            ],
+        )
+        check_result = subprocess.run(
+            ["bash", "-c", check_script],
+            stdout=subprocess.PIPE,
+        )
+        assert check_result.returncode == 0
+        assert (
+            check_result.stdout.decode().strip().splitlines()[-1]
+            == "success success success|0"
+        )
+
+        os.remove(transaction_plan.filename)
+        os.remove(f"{transaction_plan.uuid}.sh")
+        source_file.close()
+        payment_file.close()
@@ -1,3 +1,4 @@
+import math
 from copy import deepcopy
 from unittest import TestCase
 from unittest.mock import patch
@@ -237,3 +238,26 @@ class TestProcess(TestCase):
                 result = e
 
         assert isinstance(result, list)
+
+    def test_probe_count_on_non_linear_sizes(self):
+        output_list = [
+            PaymentDetail(address="test_address", amount=1000) for _ in range(2000)
+        ]
+
+        def mock_transaction_byte_size(input_arg, output_arg, method, network):
+            # Outputs past the 300th get much bigger, so the size curve bends
+            num_output = len(output_arg)
+            return 200 + 50 * num_output + max(0, num_output - 300) * 2000
+
+        with patch(
+            "cardano_mass_payments.utils.script_utils.get_protocol_parameters",
+            return_value={"max_tx_size": 16384},
+        ), patch(
+            "cardano_mass_payments.utils.script_utils.get_transaction_byte_size",
+            side_effect=mock_transaction_byte_size,
+        ) as mock_byte_size:
+            result = group_output_utxo(output_list=output_list)
+
+        assert [len(group) for group in result] == [300] * 6 + [200]
+        # Initial size, then at most a prediction and a bisection per halving
+        assert mock_byte_size.call_count <= 2 * math.ceil(math.log2(2000)) + 1